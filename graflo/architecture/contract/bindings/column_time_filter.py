@@ -12,12 +12,13 @@ import re
 from datetime import date, datetime, time
 from typing import TYPE_CHECKING, Self
 
-import pandas as pd
 from pydantic import Field, model_validator
 
 from graflo.architecture.base import ConfigBaseModel
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from graflo.filter.onto import FilterExpression
 
 _DATE_ONLY = re.compile(r"^\d{4}-\d{2}-\d{2}\Z")
@@ -108,6 +109,8 @@ class ColumnTimeFilter(ConfigBaseModel):
         return self
 
     def _validated_timedelta(self) -> pd.Timedelta:
+        import pandas as pd
+
         assert self.interval is not None
         try:
             td = pd.Timedelta(self.interval)
@@ -121,13 +124,17 @@ class ColumnTimeFilter(ConfigBaseModel):
             )
         return td
 
-    def _interval_upper_literal(self) -> str:
+    def _interval_literals(self) -> tuple[str, str]:
+        """Return ``(lower, upper)`` literals for ``[start, start + interval)``."""
         assert self.start is not None and self.interval is not None
         start_dt, date_only = parse_iso_date_or_datetime(self.start)
         delta = self._validated_timedelta().to_pytimedelta()
         end_dt = start_dt + delta
         upper_date_only = date_only and (end_dt.time() == time.min)
-        return format_sql_literal(end_dt, upper_date_only)
+        return (
+            format_sql_literal(start_dt, date_only),
+            format_sql_literal(end_dt, upper_date_only),
+        )
 
     def _lower_literal(self) -> str:
         assert self.start is not None
@@ -158,14 +165,14 @@ class ColumnTimeFilter(ConfigBaseModel):
         leaves: list[FilterExpression] = []
 
         if self.interval is not None:
-            assert self.start is not None
-            # Half-open window [start, start + interval).
+            # Half-open window [start, start + interval); start is parsed once.
+            lower, upper = self._interval_literals()
             leaves.append(
                 FilterExpression(
                     kind="leaf",
                     field=self.column,
                     cmp_operator=ComparisonOperator.GE,
-                    value=[self._lower_literal()],
+                    value=[lower],
                 )
             )
             leaves.append(
@@ -173,7 +180,7 @@ class ColumnTimeFilter(ConfigBaseModel):
                     kind="leaf",
                     field=self.column,
                     cmp_operator=ComparisonOperator.LT,
-                    value=[self._interval_upper_literal()],
+                    value=[upper],
                 )
             )
         else:
@@ -4,23 +4,26 @@ from __future__ import annotations
 
 import abc
 import hashlib
+import inspect
 import json
 import pathlib
 import re
-from typing import TYPE_CHECKING, Any, Literal, Self
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Self
 
 from pydantic import (
     AliasChoices,
     ConfigDict,
     Field,
+    PrivateAttr,
     ValidationError,
     field_validator,
     model_validator,
 )
 
 from graflo.architecture.base import ConfigBaseModel
-from graflo.filter.select import JoinClause
-from graflo.onto import BaseEnum
+from graflo.filter.onto import FilterExpression, parse_filter_expression
+from graflo.filter.select import JoinClause, SelectSpec
+from graflo.onto import BaseEnum, ExpressionFlavor
 
 from .column_time_filter import ColumnTimeFilter
 
@@ -31,7 +34,6 @@ if TYPE_CHECKING:
     from graflo.connections.sources import ApiAuth, KafkaConnConfig
     from graflo.data_source.api import APIConfig
     from graflo.data_source.kafka import KafkaConfig
-    from graflo.filter.onto import FilterExpression
 
 
 class BoundSourceKind(BaseEnum):
@@ -92,6 +94,9 @@ class ResourceConnector(ConfigBaseModel, abc.ABC):
     connector linkage is handled by ``Bindings``.
     """
 
+    # Set by each concrete connector class; checked in __pydantic_init_subclass__.
+    source_kind: ClassVar[BoundSourceKind]
+
     name: str | None = Field(
         default=None,
         description="Optional connector name used by top-level resource_connector mapping.",
@@ -114,6 +119,14 @@ class ResourceConnector(ConfigBaseModel, abc.ABC):
         ),
     )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        if not inspect.isabstract(cls) and not isinstance(
+            getattr(cls, "source_kind", None), BoundSourceKind
+        ):
+            raise TypeError(f"{cls.__name__} must set source_kind to a BoundSourceKind")
+
     def _hash_payload(self) -> dict[str, Any]:
         payload = self.model_dump(
             mode="json",
@@ -146,9 +159,9 @@ class ResourceConnector(ConfigBaseModel, abc.ABC):
             bool: True if connector matches
         """
 
-    @abc.abstractmethod
     def bound_source_kind(self) -> BoundSourceKind:
         """Return the physical source kind for this connector."""
+        return self.source_kind
 
 
 class FileConnector(ResourceConnector):
@@ -161,17 +174,25 @@ class FileConnector(ResourceConnector):
             :class:`TableConnector`), using :class:`~graflo.architecture.contract.bindings.column_time_filter.ColumnTimeFilter`.
     """
 
+    source_kind: ClassVar[BoundSourceKind] = BoundSourceKind.FILE
+
     regex: str | None = None
     sub_path: pathlib.Path = Field(default_factory=lambda: pathlib.Path("./"))
     time_filter: ColumnTimeFilter | None = None
+    _compiled_regex: re.Pattern[str] | None = PrivateAttr(default=None)
 
     @model_validator(mode="after")
     def _validate_file_connector(self) -> Self:
-        """Ensure sub_path is a Path."""
-        if not isinstance(self.sub_path, pathlib.Path):
-            object.__setattr__(self, "sub_path", pathlib.Path(self.sub_path))
+        """Compile ``regex`` once for matching."""
         if self.row_annotations:
             raise ValueError("row_annotations is not implemented for FileConnector")
+        compiled: re.Pattern[str] | None = None
+        if self.regex is not None:
+            try:
+                compiled = re.compile(self.regex)
+            except re.error as e:
+                raise ValueError(f"Invalid regex {self.regex!r}: {e}") from e
+        object.__setattr__(self, "_compiled_regex", compiled)
         return self
 
     @property
@@ -188,13 +209,23 @@ class FileConnector(ResourceConnector):
         Returns:
             bool: True if connector matches
         """
-        if self.regex is None:
-            return False
-        return bool(re.match(self.regex, resource_identifier))
+        compiled = self._compiled_regex
+        return compiled is not None and compiled.match(resource_identifier) is not None
 
-    def bound_source_kind(self) -> BoundSourceKind:
-        """File connector always uses ``BoundSourceKind.FILE``."""
-        return BoundSourceKind.FILE
+    def matches_file_name(self, name: str) -> bool:
+        """Check if a file name passes this connector's ``regex`` filter.
+
+        Unlike :meth:`matches`, the pattern may match anywhere in *name*
+        (``re.search``), and a connector without ``regex`` accepts every file.
+
+        Args:
+            name: File name to check
+
+        Returns:
+            bool: True if the file belongs to this connector
+        """
+        compiled = self._compiled_regex
+        return compiled is None or compiled.search(name) is not None
 
 
 class TableConnector(ResourceConnector):
@@ -216,6 +247,8 @@ class TableConnector(ResourceConnector):
             base table (plus aliased columns from joins).
     """
 
+    source_kind: ClassVar[BoundSourceKind] = BoundSourceKind.SQL_TABLE
+
     table_name: str = Field(
         default="", validation_alias=AliasChoices("table_name", "table")
     )
@@ -244,12 +277,12 @@ class TableConnector(ResourceConnector):
         default=None,
         description="SelectSpec or dict for declarative view (alternative to table+joins+filters).",
     )
+    _compiled_table_regex: re.Pattern[str] | None = PrivateAttr(default=None)
+    _schema_prefix: str | None = PrivateAttr(default=None)
 
     @field_validator("filters", mode="before")
     @classmethod
     def _coerce_filters(cls, v: Any) -> list[Any]:
-        from graflo.filter.onto import parse_filter_expression
-
         if v is None:
             return []
         if not isinstance(v, list):
@@ -268,8 +301,6 @@ class TableConnector(ResourceConnector):
         if v is None:
             return None
         if isinstance(v, dict):
-            from graflo.filter.select import SelectSpec
-
             return SelectSpec.from_dict(v)
         return v
 
@@ -291,6 +322,22 @@ class TableConnector(ResourceConnector):
             )
         if self.row_annotations:
             raise ValueError("row_annotations is not implemented for TableConnector")
+        # Plain table names match by string equality; only ^/$ anchored names
+        # are regex expressions and get compiled.
+        compiled: re.Pattern[str] | None = None
+        if self.table_name.startswith("^") or self.table_name.endswith("$"):
+            try:
+                compiled = re.compile(self.table_name)
+            except re.error as e:
+                raise ValueError(
+                    f"Invalid table_name regex {self.table_name!r}: {e}"
+                ) from e
+        object.__setattr__(self, "_compiled_table_regex", compiled)
+        object.__setattr__(
+            self,
+            "_schema_prefix",
+            f"{self.schema_name}." if self.schema_name else None,
+        )
         return self
 
     @property
@@ -310,28 +357,24 @@ class TableConnector(ResourceConnector):
         if not self.table_name:
             return False
 
-        # Compile regex expression
-        if self.table_name.startswith("^") or self.table_name.endswith("$"):
-            # Already a regex expression
-            compiled_regex = re.compile(self.table_name)
-        else:
+        schema_prefix = self._schema_prefix
+        compiled_regex = self._compiled_table_regex
+        if compiled_regex is None:
             # Exact match expression
-            compiled_regex = re.compile(f"^{re.escape(self.table_name)}$")
+            return resource_identifier == self.table_name or (
+                schema_prefix is not None
+                and schema_prefix + resource_identifier == self.table_name
+            )
 
         # Check if resource_identifier matches
         if compiled_regex.match(resource_identifier):
             return True
 
         # If schema_name is specified, also check schema.table format
-        if self.schema_name:
-            full_name = f"{self.schema_name}.{resource_identifier}"
-            if compiled_regex.match(full_name):
-                return True
-
-        return False
-
-    def bound_source_kind(self) -> BoundSourceKind:
-        return BoundSourceKind.SQL_TABLE
+        return (
+            schema_prefix is not None
+            and compiled_regex.match(schema_prefix + resource_identifier) is not None
+        )
 
     def build_where_clause(self, base_alias: str | None = None) -> str:
         """Build SQL WHERE clause from time filter **and** general filters.
@@ -339,8 +382,6 @@ class TableConnector(ResourceConnector):
         Returns:
             WHERE clause string (without the WHERE keyword) or empty string if no filters
         """
-        from graflo.onto import ExpressionFlavor
-
         conditions: list[str] = []
 
         if self.time_filter is not None:
@@ -378,15 +419,12 @@ class TableConnector(ResourceConnector):
             Complete SQL query string.
         """
         schema = self.schema_name or effective_schema or "public"
-        if self.view is not None:
-            from graflo.filter.select import SelectSpec
-
-            if isinstance(self.view, SelectSpec):
-                query = self.view.build_sql(schema=schema, base_table=self.table_name)
-                where = self.build_where_clause(base_alias=self.view.base_alias)
-                if where:
-                    return self._append_where_condition(query, where)
-                return query
+        if isinstance(self.view, SelectSpec):
+            query = self.view.build_sql(schema=schema, base_table=self.table_name)
+            where = self.build_where_clause(base_alias=self.view.base_alias)
+            if where:
+                return self._append_where_condition(query, where)
+            return query
         base_alias = self.base_alias if self.joins else None
         base_ref = f'"{schema}"."{self.table_name}"'
         if base_alias:
@@ -402,7 +440,6 @@ class TableConnector(ResourceConnector):
             select_parts.append(f"{base_alias}.*")
             for jc in self.joins:
                 alias = jc.alias or jc.table
-                jc_schema = jc.schema_name or schema
                 if jc.select_fields is not None:
                     for col in jc.select_fields:
                         select_parts.append(f'{alias}."{col}" AS "{alias}__{col}"')
@@ -414,7 +451,7 @@ class TableConnector(ResourceConnector):
         select_clause = ", ".join(select_parts)
 
         # --- FROM + JOINs ---
-        from_clause = base_ref_aliased
+        from_parts: list[str] = [base_ref_aliased]
         for jc in self.joins:
             jc_schema = jc.schema_name or schema
             alias = jc.alias or jc.table
@@ -423,18 +460,16 @@ class TableConnector(ResourceConnector):
                 f'{base_alias}."{jc.on_self}"' if base_alias else f'"{jc.on_self}"'
             )
             right_col = f'{alias}."{jc.on_other}"'
-            from_clause += (
-                f" {jc.join_type} JOIN {join_ref} {alias} ON {left_col} = {right_col}"
+            from_parts.append(
+                f"{jc.join_type} JOIN {join_ref} {alias} ON {left_col} = {right_col}"
             )
-
-        query = f"SELECT {select_clause} FROM {from_clause}"
+        from_clause = " ".join(from_parts)
 
         # --- WHERE ---
         where = self.build_where_clause(base_alias=base_alias)
         if where:
-            query += f" WHERE {where}"
-
-        return query
+            return f"SELECT {select_clause} FROM {from_clause} WHERE {where}"
+        return f"SELECT {select_clause} FROM {from_clause}"
 
     @staticmethod
     def _append_where_condition(query: str, condition: str) -> str:
@@ -475,8 +510,6 @@ class TableConnector(ResourceConnector):
     def _coerce_filter_expression(
         cls, raw_filter: Any, base_alias: str | None
     ) -> FilterExpression | None:
-        from graflo.filter.onto import parse_filter_expression
-
         if raw_filter is None:
             return None
         expr = parse_filter_expression(raw_filter)
@@ -505,6 +538,8 @@ class SparqlConnector(ResourceConnector):
             ``.jsonld``).  Mutually exclusive with *endpoint_url*.
     """
 
+    source_kind: ClassVar[BoundSourceKind] = BoundSourceKind.SPARQL
+
     rdf_class: str = Field(
         ..., description="URI of the rdf:Class to fetch instances of"
     )
@@ -520,6 +555,8 @@ class SparqlConnector(ResourceConnector):
     rdf_file: pathlib.Path | None = Field(
         default=None, description="Path to a local RDF file"
     )
+    _local_name: str = PrivateAttr(default="")
+    _select_query: str = PrivateAttr(default="")
 
     @model_validator(mode="after")
     def _reject_row_annotations(self) -> Self:
@@ -528,6 +565,29 @@ class SparqlConnector(ResourceConnector):
             raise ValueError("row_annotations is not implemented for SparqlConnector")
         return self
 
+    @model_validator(mode="after")
+    def _derive_query_strings(self) -> Self:
+        object.__setattr__(
+            self,
+            "_local_name",
+            self.rdf_class.rsplit("#", 1)[-1].rsplit("/", 1)[-1],
+        )
+        if self.sparql_query:
+            select_query = self.sparql_query
+        else:
+            graph_open = f"GRAPH <{self.graph_uri}> {{" if self.graph_uri else ""
+            graph_close = "}" if self.graph_uri else ""
+            select_query = (
+                "SELECT ?s ?p ?o WHERE { "
+                f"{graph_open} "
+                f"?s a <{self.rdf_class}> . "
+                f"?s ?p ?o . "
+                f"{graph_close} "
+                "}"
+            )
+        object.__setattr__(self, "_select_query", select_query)
+        return self
+
     def matches(self, resource_identifier: str) -> bool:
         """Match by the local name (fragment) of the rdf:Class URI.
 
@@ -537,18 +597,13 @@ class SparqlConnector(ResourceConnector):
         Returns:
             True when *resource_identifier* equals the class local name
         """
-        local_name = self.rdf_class.rsplit("#", 1)[-1].rsplit("/", 1)[-1]
-        return resource_identifier == local_name
-
-    def bound_source_kind(self) -> BoundSourceKind:
-        """Return ``BoundSourceKind.SPARQL``."""
-        return BoundSourceKind.SPARQL
+        return resource_identifier == self._local_name
 
     def build_select_query(self) -> str:
-        """Build a SPARQL SELECT query for instances of ``rdf_class``.
+        """Return the SPARQL SELECT query for instances of ``rdf_class``.
 
-        If *sparql_query* is set it is returned as-is.  Otherwise a simple
-        per-class query is generated::
+        The query is rendered at validation time.  If *sparql_query* is set it
+        is returned as-is.  Otherwise a simple per-class query is generated::
 
             SELECT ?s ?p ?o WHERE {
               ?s a <rdf_class> .
@@ -558,20 +613,7 @@ class SparqlConnector(ResourceConnector):
         Returns:
             SPARQL query string
         """
-        if self.sparql_query:
-            return self.sparql_query
-
-        graph_open = f"GRAPH <{self.graph_uri}> {{" if self.graph_uri else ""
-        graph_close = "}" if self.graph_uri else ""
-
-        return (
-            "SELECT ?s ?p ?o WHERE { "
-            f"{graph_open} "
-            f"?s a <{self.rdf_class}> . "
-            f"?s ?p ?o . "
-            f"{graph_close} "
-            "}"
-        )
+        return self._select_query
 
 
 class ApiResponseStructure(ConfigBaseModel):
@@ -695,6 +737,8 @@ class APIConnector(ResourceConnector):
         verify: Verify SSL certificates.
     """
 
+    source_kind: ClassVar[BoundSourceKind] = BoundSourceKind.API
+
     path: str = Field(..., description="Relative API endpoint path")
     method: str = "GET"
     params: dict[str, Any] = Field(default_factory=dict)
@@ -721,9 +765,6 @@ class APIConnector(ResourceConnector):
         path_tail = self.path.rstrip("/").rsplit("/", 1)[-1]
         return resource_identifier in {self.path, path_tail}
 
-    def bound_source_kind(self) -> BoundSourceKind:
-        return BoundSourceKind.API
-
     def build_api_config(
         self,
         *,
@@ -784,6 +825,8 @@ class KafkaConnector(ResourceConnector):
         row_annotations: Constant fields merged into every decoded row (doc wins).
     """
 
+    source_kind: ClassVar[BoundSourceKind] = BoundSourceKind.KAFKA
+
     topics: list[str] = Field(..., min_length=1, description="Kafka topics to consume")
     group_id: str = Field(..., description="Consumer group id")
     auto_offset_reset: Literal["earliest", "latest"] = "earliest"
@@ -821,9 +864,6 @@ class KafkaConnector(ResourceConnector):
             return True
         return resource_identifier in self.topics
 
-    def bound_source_kind(self) -> BoundSourceKind:
-        return BoundSourceKind.KAFKA
-
     def build_kafka_config(
         self,
         *,
@@ -253,8 +253,10 @@ class BindingsConfig(ConfigBaseModel):
     _connector_connection_typed: list[ConnectorConnectionBinding] = PrivateAttr(
         default_factory=list
     )
-    _connectors_index: dict[str, ResourceConnector] = PrivateAttr(default_factory=dict)
+    _connectors_index: dict[str, AnyConnector] = PrivateAttr(default_factory=dict)
     _connectors_name_index: dict[str, str] = PrivateAttr(default_factory=dict)
+    # Connector reference (hash or name) -> hash; hashes win over equal names.
+    _connector_ref_index: dict[str, str] = PrivateAttr(default_factory=dict)
     _resource_to_connector_hashes: dict[str, list[str]] = PrivateAttr(
         default_factory=dict
     )
@@ -278,7 +280,8 @@ class BindingsConfig(ConfigBaseModel):
     def _expand_connector_templates(cls, data: Any) -> Any:
         if not isinstance(data, dict):
             return data
-        return _expand_connectors_from_templates(dict(data))
+        # The expander copies ``data`` itself before writing expanded entries.
+        return _expand_connectors_from_templates(data)
 
     @field_validator("connector_templates", mode="before")
     @classmethod
@@ -350,26 +353,35 @@ class BindingsConfig(ConfigBaseModel):
         return self._staging_name_to_conn_proxy.get(name)
 
     def _rebuild_indexes(self) -> None:
-        self._connectors_index = {}
-        self._connectors_name_index = {}
+        # Private attributes resolve through BaseModel.__getattr__; fill locals
+        # and assign once.
+        connectors_index: dict[str, AnyConnector] = {}
+        name_index: dict[str, str] = {}
         for connector in self.connectors:
-            existing = self._connectors_index.get(connector.hash)
+            connector_hash = connector.hash
+            existing = connectors_index.get(connector_hash)
             if existing is not None:
                 raise ValueError(
                     "Connector hash collision detected for connectors "
                     f"'{type(existing).__name__}' and '{type(connector).__name__}' "
-                    f"(hash='{connector.hash}')."
+                    f"(hash='{connector_hash}')."
                 )
-            self._connectors_index[connector.hash] = connector
+            connectors_index[connector_hash] = connector
 
             if connector.name:
-                existing_hash = self._connectors_name_index.get(connector.name)
-                if existing_hash is not None and existing_hash != connector.hash:
+                existing_hash = name_index.get(connector.name)
+                if existing_hash is not None and existing_hash != connector_hash:
                     raise ValueError(
                         "Connector names must be unique when provided. "
                         f"Duplicate connector name '{connector.name}'."
                     )
-                self._connectors_name_index[connector.name] = connector.hash
+                name_index[connector.name] = connector_hash
+        self._connectors_index = connectors_index
+        self._connectors_name_index = name_index
+        self._connector_ref_index = {
+            **name_index,
+            **{h: h for h in connectors_index},
+        }
 
     def _append_resource_connector_hash(
         self, resource_name: str, connector_hash: str
@@ -498,24 +510,25 @@ class BindingsConfig(ConfigBaseModel):
         ]
         self._rebuild_staging_proxy_index()
 
+        append_hash = self._append_resource_connector_hash
         for connector in self.connectors:
             if connector.resource_name is None:
                 continue
-            self._append_resource_connector_hash(
-                connector.resource_name, connector.hash
-            )
+            append_hash(connector.resource_name, connector.hash)
 
+        name_index = self._connectors_name_index
+        connectors_index = self._connectors_index
         for mapping in self._resource_connector_typed:
-            connector_hash = self._connectors_name_index.get(mapping.connector)
+            connector_hash = name_index.get(mapping.connector)
             if connector_hash is None:
-                if mapping.connector in self._connectors_index:
+                if mapping.connector in connectors_index:
                     connector_hash = mapping.connector
                 else:
                     raise ValueError(
                         f"resource_connector references unknown connector '{mapping.connector}' "
                         f"for resource '{mapping.resource}'."
                     )
-            self._append_resource_connector_hash(mapping.resource, connector_hash)
+            append_hash(mapping.resource, connector_hash)
         self._rebuild_connector_to_conn_proxy()
         return self
 
@@ -529,9 +542,7 @@ class BindingsConfig(ConfigBaseModel):
         Ingestion resource names are not valid connector references (a resource
         may map to multiple connectors).
         """
-        if connector_ref in self._connectors_index:
-            return connector_ref
-        resolved_hash = self._connectors_name_index.get(connector_ref)
+        resolved_hash = self._connector_ref_index.get(connector_ref)
         if resolved_hash is None:
             raise ValueError(f"Unknown connector reference '{connector_ref}'")
         return resolved_hash
@@ -563,21 +574,14 @@ class BindingsConfig(ConfigBaseModel):
 
     def get_connectors_for_resource(self, resource_name: str) -> list[AnyConnector]:
         """Return connectors bound to *resource_name*, in binding order (unique by hash)."""
-        result: list[AnyConnector] = []
-        for h in self._resource_to_connector_hashes.get(resource_name, []):
-            c = self._connectors_index.get(h)
-            if isinstance(
-                c,
-                (
-                    TableConnector,
-                    FileConnector,
-                    SparqlConnector,
-                    APIConnector,
-                    KafkaConnector,
-                ),
-            ):
-                result.append(c)
-        return result
+        # The index only ever holds entries of ``connectors`` (typed AnyConnector),
+        # so membership is the only check needed.
+        index = self._connectors_index
+        return [
+            index[h]
+            for h in self._resource_to_connector_hashes.get(resource_name, ())
+            if h in index
+        ]
 
     @classmethod
     def from_dict(cls, data: dict[str, Any] | list[Any]) -> Self:
@@ -658,11 +662,7 @@ class BindingsRegistry(BindingsConfig):
             return
         merged = old.model_dump(mode="python")
         merged.update(patch)
-        new = cast(
-            AnyConnector,
-            old.__class__.model_validate(merged),
-        )
-        self.replace_connector(old, new)
+        self.replace_connector(old, old.__class__.model_validate(merged))
 
     def replace_connector(
         self,
@@ -184,9 +184,11 @@ class IngestionModel(ConfigBaseModel):
             if not any(a.references_vertices() for a in root.collect_actors()):
                 to_drop.append(resource_config)
 
+        if not to_drop:
+            return
+        dropped_ids = {id(dropped) for dropped in to_drop}
+        self.resources[:] = [r for r in self.resources if id(r) not in dropped_ids]
         for dropped in to_drop:
-            self.resources.remove(dropped)
             self._resources.pop(dropped.name, None)
             self._runtimes.pop(dropped.name, None)
-        if to_drop:
-            self._rebuild_config_state()
+        self._rebuild_config_state()
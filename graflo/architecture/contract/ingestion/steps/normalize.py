@@ -29,7 +29,6 @@ def normalize_actor_step(data: dict[str, Any]) -> dict[str, Any]:
         data["type"] = "edge"
         return data
     if ("source" in data or "from" in data) and ("target" in data or "to" in data):
-        data = dict(data)
         data["type"] = "edge"
         return data
     if "create_edge" in data:
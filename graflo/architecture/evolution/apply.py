@@ -128,8 +128,11 @@ def _prune_ingestion_for_removed_vertices(
         if not any(a.references_vertices() for a in root.collect_actors()):
             to_drop.append(resource)
 
-    for r in to_drop:
-        im.resources.remove(r)
+    if to_drop:
+        # One filtering pass by identity; ``list.remove`` rescans the list and
+        # compares resources field-by-field for every dropped entry.
+        dropped_ids = {id(r) for r in to_drop}
+        im.resources[:] = [r for r in im.resources if id(r) not in dropped_ids]
 
     for i, r in enumerate(list(im.resources)):
         new_mc = [c for c in r.merge_collections if c not in removed]
@@ -1382,8 +1385,9 @@ def apply_sanitize(manifest: GraphManifest, op: SanitizeOp) -> None:
         return
 
     schema = manifest.graph_schema
+    reserved_words: frozenset[str]
     if op.reserved_words is not None:
-        reserved_words = {word.upper() for word in op.reserved_words}
+        reserved_words = frozenset(word.upper() for word in op.reserved_words)
     else:
         reserved_words = load_reserved_words(op.db_flavor)
 
@@ -1406,6 +1410,10 @@ def apply_sanitize(manifest: GraphManifest, op: SanitizeOp) -> None:
                 RenameVertexPropertiesOp(renames=field_renames),
             )
 
+    # Identity normalization is TigerGraph-only; other flavors are done here.
+    if op.db_flavor != DBType.TIGERGRAPH:
+        return
+
     identity_renames = normalize_relation_identity(schema, op.db_flavor)
     if identity_renames:
         apply_field_rename_to_db_profile(schema.db_profile, identity_renames)
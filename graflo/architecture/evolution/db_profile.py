@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Set as AbstractSet
+from functools import lru_cache
 from typing import Any
 
 from graflo.architecture.graph_types import EdgeId, EdgePhysicalKey, Index
@@ -207,11 +209,15 @@ def apply_vertex_merge_to_db_profile(
 
 def _storage_name_sanitizer(
     profile: DatabaseProfile,
-    reserved_words: set[str],
+    reserved_words: AbstractSet[str],
     *,
     db_flavor: DBType | None = None,
 ):
-    """Return ``(sanitize, should_run)`` for storage/relation name sanitization."""
+    """Return ``(sanitize, should_run)`` for storage/relation name sanitization.
+
+    The returned callable is memoized per ``(name, suffix)``; many edges share
+    a relation name, so most calls are cache hits.
+    """
     from graflo.db.util import (
         load_tigergraph_identifier_rules,
         sanitize_attribute_name,
@@ -225,12 +231,14 @@ def _storage_name_sanitizer(
             if not reserved_words:
                 return None, False
             return (
-                lambda name, suffix: sanitize_attribute_name(
-                    name, reserved_words, suffix=suffix
+                lru_cache(maxsize=None)(
+                    lambda name, suffix: sanitize_attribute_name(
+                        name, reserved_words, suffix=suffix
+                    )
                 ),
                 True,
             )
-        effective_reserved = reserved_words or set(rules.reserved_words_upper)
+        effective_reserved = reserved_words or rules.reserved_words_upper
 
         def sanitize(name: str, suffix: str) -> str:
             return sanitize_tigergraph_identifier(
@@ -241,14 +249,16 @@ def _storage_name_sanitizer(
                 suffix=suffix,
             )
 
-        return sanitize, True
+        return lru_cache(maxsize=None)(sanitize), True
 
     if not reserved_words:
         return None, False
 
     return (
-        lambda name, suffix: sanitize_attribute_name(
-            name, reserved_words, suffix=suffix
+        lru_cache(maxsize=None)(
+            lambda name, suffix: sanitize_attribute_name(
+                name, reserved_words, suffix=suffix
+            )
         ),
         True,
     )
@@ -257,7 +267,7 @@ def _storage_name_sanitizer(
 def apply_storage_name_sanitization_to_db_profile(
     profile: DatabaseProfile,
     schema: Schema,
-    reserved_words: set[str],
+    reserved_words: AbstractSet[str],
     *,
     db_flavor: DBType | None = None,
 ) -> None:
@@ -290,11 +300,12 @@ def apply_storage_name_sanitization_to_db_profile(
             logger.debug("Sanitizing vertex name '%s' -> '%s'", dbname, sanitized)
             profile.vertex_storage_names[vertex.name] = sanitized
 
-    vertex_storage_names = {
+    vertex_storage_names: set[str] = {
         profile.vertex_storage_name(vertex.name)
         for vertex in schema.core_schema.vertex_config.vertices
     }
 
+    edge_relations: list[tuple[Edge, str]] = []
     for edge in schema.core_schema.edge_config.edges:
         if not edge.relation:
             continue
@@ -302,17 +313,36 @@ def apply_storage_name_sanitization_to_db_profile(
             edge.edge_id,
             default_relation=edge.relation,
         )
-        if original is None:
-            continue
-        sanitized = sanitize(original, suffix=f"_{RELATION_SUFFIX}")
-        if sanitized in vertex_storage_names:
-            base = f"{sanitized}_{RELATION_SUFFIX}"
-            candidate = base
-            counter = 1
-            while candidate in vertex_storage_names:
-                candidate = f"{base}_{counter}"
-                counter += 1
-            sanitized = candidate
+        if original is not None:
+            edge_relations.append((edge, original))
+
+    # Physical relation name -> the original relation that claimed it. Seeded
+    # with names that survive sanitization unchanged, so a distinct relation
+    # whose sanitized form lands on one of them (``a-b`` vs ``a__b``) is
+    # suffixed instead of silently sharing the physical relation.
+    relation_owners: dict[str, str] = {
+        original: original
+        for _, original in edge_relations
+        if sanitize(original, suffix=f"_{RELATION_SUFFIX}") == original
+    }
+    # Last suffix that resolved a collision for each base, so later relations
+    # resume from it instead of rescanning base, base_1, base_2, ...
+    relation_suffix_counters: dict[str, int] = {}
+    # Original relation -> resolved physical name; edges sharing a relation
+    # must land on the same physical relation.
+    resolved_relations: dict[str, str] = {}
+
+    for edge, original in edge_relations:
+        sanitized = resolved_relations.get(original)
+        if sanitized is None:
+            sanitized = _resolve_relation_name(
+                original,
+                sanitize,
+                vertex_storage_names,
+                relation_owners,
+                relation_suffix_counters,
+            )
+            resolved_relations[original] = sanitized
 
         if sanitized != original:
             profile.set_edge_name_spec(
@@ -321,11 +351,42 @@ def apply_storage_name_sanitization_to_db_profile(
             )
 
 
+def _resolve_relation_name(
+    original: str,
+    sanitize,
+    vertex_storage_names: set[str],
+    relation_owners: dict[str, str],
+    relation_suffix_counters: dict[str, int],
+) -> str:
+    """Return a physical name for *original* that no vertex or other relation holds."""
+    sanitized = sanitize(original, suffix=f"_{RELATION_SUFFIX}")
+    if (
+        sanitized in vertex_storage_names
+        or relation_owners.get(sanitized, original) != original
+    ):
+        base = f"{sanitized}_{RELATION_SUFFIX}"
+        counter = relation_suffix_counters.get(base, 0)
+        candidate = f"{base}_{counter}" if counter else base
+        while (
+            candidate in vertex_storage_names
+            or relation_owners.get(candidate, original) != original
+        ):
+            counter += 1
+            candidate = f"{base}_{counter}"
+        relation_suffix_counters[base] = counter
+        sanitized = candidate
+    relation_owners.setdefault(sanitized, original)
+    return sanitized
+
+
 def _rewrite_index_fields(indexes: list[Index], renames: dict[str, str]) -> list[Index]:
     if not renames:
         return indexes
     new_indexes: list[Index] = []
     for idx in indexes:
+        if renames.keys().isdisjoint(idx.fields):
+            new_indexes.append(idx)
+            continue
         new_fields = [renames.get(f, f) for f in idx.fields]
         if new_fields == list(idx.fields):
             new_indexes.append(idx)
@@ -356,7 +417,10 @@ def apply_field_rename_to_db_profile(
 
     new_vertex_indexes: dict[str, list[Index]] = {}
     for vertex_name, indexes in profile.vertex_indexes.items():
-        per_vertex = renames.get(vertex_name) or {}
+        per_vertex = renames.get(vertex_name)
+        if not per_vertex:
+            new_vertex_indexes[vertex_name] = list(indexes)
+            continue
         new_vertex_indexes[vertex_name] = _rewrite_index_fields(
             list(indexes), per_vertex
         )
@@ -373,6 +437,9 @@ def apply_field_rename_to_db_profile(
         merged: dict[str, str] = {}
         merged.update(renames.get(source_name) or {})
         merged.update(renames.get(target_name) or {})
+        if not merged or not spec.indexes:
+            new_specs.append(spec)
+            continue
         new_specs.append(
             EdgePhysicalSpec(
                 source=spec.source,
@@ -6,11 +6,20 @@ from collections.abc import Callable
 from copy import deepcopy
 from typing import Any
 
+from graflo.architecture.contract.ingestion.resource import (
+    collect_vertex_names_from_pipeline,
+)
 from graflo.architecture.contract.ingestion.steps.normalize import (
     normalize_actor_step,
 )
 
 
+def _remap_obs_key(obs_key: Any, renames: dict[str, str]) -> Any:
+    if isinstance(obs_key, str):
+        return renames.get(obs_key, obs_key)
+    return obs_key
+
+
 def rewrite_vertex_weights_vertex_field_names(
     weights: list[Any],
     renames_by_vertex: dict[str, dict[str, str]],
@@ -37,13 +46,8 @@ def rewrite_vertex_weights_vertex_field_names(
                 for fname in w.fields
             ]
 
-            def _remap_obs_key(obs_key: Any, _per: dict = per) -> Any:
-                if isinstance(obs_key, str):
-                    return _per.get(obs_key, obs_key)
-                return obs_key
-
-            new_map = {_remap_obs_key(k): v for k, v in dict(w.map).items()}
-            new_filter = {_remap_obs_key(k): v for k, v in dict(w.filter).items()}
+            new_map = {_remap_obs_key(k, per): v for k, v in dict(w.map).items()}
+            new_filter = {_remap_obs_key(k, per): v for k, v in dict(w.filter).items()}
             w = w.model_copy(
                 update={"fields": new_fields, "map": new_map, "filter": new_filter}
             )
@@ -659,28 +663,48 @@ def _step_vertices(step: dict[str, Any]) -> set[str]:
     return set()
 
 
-def _collect_level_vertices(steps: list[Any]) -> set[str]:
-    """Collect vertex names introduced at the immediate (non-recursive) level."""
-    out: set[str] = set()
-    for step in steps:
-        if isinstance(step, dict):
-            out |= _step_vertices(step)
-    return out
+def _rewrite_vertex_field_level(
+    steps: list[Any],
+    renames: dict[str, dict[str, str]],
+    parent_scope: set[str],
+) -> list[dict[str, Any]]:
+    """Rewrite one pipeline level for vertex field renames.
+
+    Each step is normalized once and reused both to collect the vertices this
+    level introduces and to rewrite it; normalizing a ``descend`` step also
+    normalizes its subtree, so deeper levels get it for free.
+    """
+    normalized = [
+        normalize_actor_step(dict(step)) for step in steps if isinstance(step, dict)
+    ]
+    scope = set(parent_scope)
+    for step in normalized:
+        scope |= _step_vertices(step)
+    # Every transform at this level sees the same scope, so merge the
+    # in-scope renames once rather than per transform step.
+    scope_renames: dict[str, str] = {}
+    for v_name in scope:
+        scope_renames.update(renames.get(v_name, {}))
+    return [
+        _rewrite_vertex_field_step(step, renames, scope, scope_renames)
+        for step in normalized
+    ]
 
 
 def _rewrite_vertex_field_step(
     step: dict[str, Any],
     renames: dict[str, dict[str, str]],
     available_vertices: set[str],
+    in_scope_renames: dict[str, str],
 ) -> dict[str, Any]:
     """Rewrite a single normalized step for vertex field renames.
 
     ``available_vertices`` is the set of vertex names in scope at the call site
-    (vertices created at this level or by ancestors). It bounds which renames
+    (vertices created at this level or by ancestors). ``in_scope_renames`` is
+    the merged field rename map of those vertices; it bounds which renames
     apply to ``transform`` rename maps.
     """
-    s = normalize_actor_step(dict(step))
-    out = deepcopy(s)
+    out = deepcopy(step)
     t = out.get("type")
 
     if t == "vertex":
@@ -701,9 +725,6 @@ def _rewrite_vertex_field_step(
                 ]
 
     elif t == "transform":
-        in_scope_renames: dict[str, str] = {}
-        for v_name in available_vertices:
-            in_scope_renames.update(renames.get(v_name, {}))
         if in_scope_renames:
             current = out.get("rename")
             # Call-mode transforms omit ``rename``. Never synthesize rename.
@@ -724,13 +745,9 @@ def _rewrite_vertex_field_step(
     elif t == "descend":
         pl = out.get("pipeline")
         if isinstance(pl, list):
-            descend_level_vertices = _collect_level_vertices(pl)
-            nested_available = available_vertices | descend_level_vertices
-            out["pipeline"] = [
-                _rewrite_vertex_field_step(x, renames, nested_available)
-                for x in pl
-                if isinstance(x, dict)
-            ]
+            out["pipeline"] = _rewrite_vertex_field_level(
+                pl, renames, available_vertices
+            )
 
     return out
 
@@ -761,13 +778,104 @@ def rewrite_vertex_field_names_in_pipeline(
     if not renames:
         return deepcopy(pipeline)
     parent_scope = set(available_vertices) if available_vertices else set()
-    level_vertices = _collect_level_vertices(pipeline)
-    scope = parent_scope | level_vertices
-    return [
-        _rewrite_vertex_field_step(step, renames, scope)
-        for step in pipeline
-        if isinstance(step, dict)
-    ]
+    # Nothing to rewrite when no renamed vertex is in scope or referenced below;
+    # still return the normalized steps the rewriting path would produce.
+    if renames.keys().isdisjoint(parent_scope) and renames.keys().isdisjoint(
+        collect_vertex_names_from_pipeline(pipeline)
+    ):
+        return [
+            deepcopy(normalize_actor_step(dict(step)))
+            for step in pipeline
+            if isinstance(step, dict)
+        ]
+    return _rewrite_vertex_field_level(pipeline, renames, parent_scope)
+
+
+def _remove_vertex_properties_in_step(
+    step: dict[str, Any],
+    removals: dict[str, set[str]],
+    blocked_fields: set[str],
+) -> dict[str, Any]:
+    out = deepcopy(normalize_actor_step(dict(step)))
+    step_type = out.get("type")
+
+    if step_type == "vertex":
+        vertex_name = out.get("vertex")
+        if isinstance(vertex_name, str):
+            removed = removals.get(vertex_name, set())
+            if removed:
+                from_map = out.get("from")
+                if isinstance(from_map, dict):
+                    out["from"] = {
+                        key: value
+                        for key, value in from_map.items()
+                        if isinstance(key, str) and key not in removed
+                    }
+                keep_fields = out.get("keep_fields")
+                if isinstance(keep_fields, list):
+                    out["keep_fields"] = [
+                        key
+                        for key in keep_fields
+                        if not (isinstance(key, str) and key in removed)
+                    ]
+
+    elif step_type == "transform":
+        rename_map = out.get("rename")
+        if isinstance(rename_map, dict):
+            out["rename"] = {
+                key: value
+                for key, value in rename_map.items()
+                if not (isinstance(value, str) and value in blocked_fields)
+            }
+
+    elif step_type == "edge":
+        weights = out.get("vertex_weights")
+        if isinstance(weights, list):
+            filtered_weights: list[dict[str, Any]] = []
+            for entry in weights:
+                if not isinstance(entry, dict):
+                    continue
+                name = entry.get("name")
+                if not isinstance(name, str):
+                    filtered_weights.append(dict(entry))
+                    continue
+                removed = removals.get(name, set())
+                if not removed:
+                    filtered_weights.append(dict(entry))
+                    continue
+                rewritten = dict(entry)
+                fields = rewritten.get("fields")
+                if isinstance(fields, list):
+                    rewritten["fields"] = [
+                        f for f in fields if not (isinstance(f, str) and f in removed)
+                    ]
+                map_payload = rewritten.get("map")
+                if isinstance(map_payload, dict):
+                    rewritten["map"] = {
+                        k: v
+                        for k, v in map_payload.items()
+                        if not (isinstance(k, str) and k in removed)
+                    }
+                filter_payload = rewritten.get("filter")
+                if isinstance(filter_payload, dict):
+                    rewritten["filter"] = {
+                        k: v
+                        for k, v in filter_payload.items()
+                        if not (isinstance(k, str) and k in removed)
+                    }
+                filtered_weights.append(rewritten)
+            out["vertex_weights"] = filtered_weights
+
+    elif step_type == "descend":
+        nested = out.get("pipeline")
+        if isinstance(nested, list):
+            out["pipeline"] = [
+                _remove_vertex_properties_in_step(item, removals, blocked_fields)
+                for item in nested
+                if isinstance(item, dict)
+            ]
+
+    return out
 
 
 def rewrite_remove_vertex_properties_in_pipeline(
@@ -777,91 +885,65 @@ def rewrite_remove_vertex_properties_in_pipeline(
     """Remove references to dropped vertex fields from pipeline steps."""
     if not removals:
         return deepcopy(pipeline)
+    blocked_fields: set[str] = set().union(*removals.values())
+    return [
+        _remove_vertex_properties_in_step(step, removals, blocked_fields)
+        for step in pipeline
+        if isinstance(step, dict)
+    ]
 
-    def _rewrite_step(step: dict[str, Any]) -> dict[str, Any]:
-        out = deepcopy(normalize_actor_step(dict(step)))
-        step_type = out.get("type")
-
-        if step_type == "vertex":
-            vertex_name = out.get("vertex")
-            if isinstance(vertex_name, str):
-                removed = removals.get(vertex_name, set())
-                if removed:
-                    from_map = out.get("from")
-                    if isinstance(from_map, dict):
-                        out["from"] = {
-                            key: value
-                            for key, value in from_map.items()
-                            if isinstance(key, str) and key not in removed
-                        }
-                    keep_fields = out.get("keep_fields")
-                    if isinstance(keep_fields, list):
-                        out["keep_fields"] = [
-                            key
-                            for key in keep_fields
-                            if not (isinstance(key, str) and key in removed)
-                        ]
-
-        elif step_type == "transform":
-            rename_map = out.get("rename")
-            if isinstance(rename_map, dict):
-                blocked_fields = set().union(*removals.values())
-                out["rename"] = {
-                    key: value
-                    for key, value in rename_map.items()
-                    if not (isinstance(value, str) and value in blocked_fields)
-                }
-
-        elif step_type == "edge":
-            weights = out.get("vertex_weights")
-            if isinstance(weights, list):
-                filtered_weights: list[dict[str, Any]] = []
-                for entry in weights:
-                    if not isinstance(entry, dict):
-                        continue
-                    name = entry.get("name")
-                    if not isinstance(name, str):
-                        filtered_weights.append(dict(entry))
-                        continue
-                    removed = removals.get(name, set())
-                    if not removed:
-                        filtered_weights.append(dict(entry))
-                        continue
-                    rewritten = dict(entry)
-                    fields = rewritten.get("fields")
-                    if isinstance(fields, list):
-                        rewritten["fields"] = [
-                            f
-                            for f in fields
-                            if not (isinstance(f, str) and f in removed)
-                        ]
-                    map_payload = rewritten.get("map")
-                    if isinstance(map_payload, dict):
-                        rewritten["map"] = {
-                            k: v
-                            for k, v in map_payload.items()
-                            if not (isinstance(k, str) and k in removed)
-                        }
-                    filter_payload = rewritten.get("filter")
-                    if isinstance(filter_payload, dict):
-                        rewritten["filter"] = {
-                            k: v
-                            for k, v in filter_payload.items()
-                            if not (isinstance(k, str) and k in removed)
-                        }
-                    filtered_weights.append(rewritten)
-                out["vertex_weights"] = filtered_weights
-
-        elif step_type == "descend":
-            nested = out.get("pipeline")
-            if isinstance(nested, list):
-                out["pipeline"] = [
-                    _rewrite_step(item) for item in nested if isinstance(item, dict)
-                ]
-
-        return out
 
-    return [_rewrite_step(step) for step in pipeline if isinstance(step, dict)]
+def _remove_relations_in_step(
+    step: dict[str, Any], removed_relations: set[str]
+) -> dict[str, Any] | None:
+    out = deepcopy(step)
+    edge_payload = out.get("edge")
+    if isinstance(edge_payload, dict):
+        relation = edge_payload.get("relation")
+        if relation in removed_relations:
+            out.pop("edge", None)
+        elif isinstance(edge_payload.get("relation_map"), dict):
+            edge_payload["relation_map"] = {
+                k: v
+                for k, v in edge_payload["relation_map"].items()
+                if not (isinstance(v, str) and v in removed_relations)
+            }
+        links = edge_payload.get("links")
+        if isinstance(links, list):
+            edge_payload["links"] = [
+                link
+                for link in links
+                if not (
+                    isinstance(link, dict) and link.get("relation") in removed_relations
+                )
+            ]
+    create_edge_payload = out.get("create_edge")
+    if isinstance(create_edge_payload, dict):
+        relation = create_edge_payload.get("relation")
+        if relation in removed_relations:
+            out.pop("create_edge", None)
+        elif isinstance(create_edge_payload.get("relation_map"), dict):
+            create_edge_payload["relation_map"] = {
+                k: v
+                for k, v in create_edge_payload["relation_map"].items()
+                if not (isinstance(v, str) and v in removed_relations)
+            }
+    descend_payload = out.get("descend")
+    if isinstance(descend_payload, dict) and isinstance(
+        descend_payload.get("pipeline"), list
+    ):
+        descend_payload["pipeline"] = [
+            nested
+            for nested in (
+                _remove_relations_in_step(item, removed_relations)
+                for item in descend_payload["pipeline"]
+                if isinstance(item, dict)
+            )
+            if nested is not None
+        ]
+    if "edge" not in out and "create_edge" not in out and out.get("type") == "edge":
+        return None
+    return out
 
 
 def rewrite_remove_relations_in_pipeline(
@@ -870,62 +952,12 @@ def rewrite_remove_relations_in_pipeline(
     """Drop edge/create_edge steps (and links) targeting removed relations."""
     if not removed_relations:
         return deepcopy(pipeline)
-
-    def _rewrite_step(step: dict[str, Any]) -> dict[str, Any] | None:
-        out = deepcopy(step)
-        edge_payload = out.get("edge")
-        if isinstance(edge_payload, dict):
-            relation = edge_payload.get("relation")
-            if relation in removed_relations:
-                out.pop("edge", None)
-            elif isinstance(edge_payload.get("relation_map"), dict):
-                edge_payload["relation_map"] = {
-                    k: v
-                    for k, v in edge_payload["relation_map"].items()
-                    if not (isinstance(v, str) and v in removed_relations)
-                }
-            links = edge_payload.get("links")
-            if isinstance(links, list):
-                edge_payload["links"] = [
-                    link
-                    for link in links
-                    if not (
-                        isinstance(link, dict)
-                        and link.get("relation") in removed_relations
-                    )
-                ]
-        create_edge_payload = out.get("create_edge")
-        if isinstance(create_edge_payload, dict):
-            relation = create_edge_payload.get("relation")
-            if relation in removed_relations:
-                out.pop("create_edge", None)
-            elif isinstance(create_edge_payload.get("relation_map"), dict):
-                create_edge_payload["relation_map"] = {
-                    k: v
-                    for k, v in create_edge_payload["relation_map"].items()
-                    if not (isinstance(v, str) and v in removed_relations)
-                }
-        descend_payload = out.get("descend")
-        if isinstance(descend_payload, dict) and isinstance(
-            descend_payload.get("pipeline"), list
-        ):
-            descend_payload["pipeline"] = [
-                nested
-                for nested in (
-                    _rewrite_step(item)
-                    for item in descend_payload["pipeline"]
-                    if isinstance(item, dict)
-                )
-                if nested is not None
-            ]
-        if "edge" not in out and "create_edge" not in out and out.get("type") == "edge":
-            return None
-        return out
-
     return [
         rewritten
         for rewritten in (
-            _rewrite_step(step) for step in pipeline if isinstance(step, dict)
+            _remove_relations_in_step(step, removed_relations)
+            for step in pipeline
+            if isinstance(step, dict)
         )
         if rewritten is not None
     ]
@@ -971,6 +1003,55 @@ def _prune_relation_map_for_removed_edge_ids(
     }
 
 
+def _remove_edge_ids_in_step(
+    step: dict[str, Any],
+    removed_edge_ids: set[tuple[str, str, str | None]],
+) -> dict[str, Any] | None:
+    out = deepcopy(step)
+    edge_payload = out.get("edge")
+    if isinstance(edge_payload, dict):
+        if _payload_targets_removed_edge(edge_payload, removed_edge_ids):
+            out.pop("edge", None)
+        else:
+            _prune_relation_map_for_removed_edge_ids(edge_payload, removed_edge_ids)
+            links = edge_payload.get("links")
+            if isinstance(links, list):
+                edge_payload["links"] = [
+                    link
+                    for link in links
+                    if not (
+                        isinstance(link, dict)
+                        and _payload_targets_removed_edge(link, removed_edge_ids)
+                    )
+                ]
+    create_edge_payload = out.get("create_edge")
+    if isinstance(create_edge_payload, dict):
+        if _payload_targets_removed_edge(create_edge_payload, removed_edge_ids):
+            out.pop("create_edge", None)
+        else:
+            _prune_relation_map_for_removed_edge_ids(
+                create_edge_payload, removed_edge_ids
+            )
+    descend_payload = out.get("descend")
+    if isinstance(descend_payload, dict) and isinstance(
+        descend_payload.get("pipeline"), list
+    ):
+        descend_payload["pipeline"] = [
+            nested
+            for nested in (
+                _remove_edge_ids_in_step(item, removed_edge_ids)
+                for item in descend_payload["pipeline"]
+                if isinstance(item, dict)
+            )
+            if nested is not None
+        ]
+    if "edge" not in out and "create_edge" not in out and out.get("type") == "edge":
+        return None
+    if not out:
+        return None
+    return out
+
+
 def rewrite_remove_edge_ids_in_pipeline(
     pipeline: list[dict[str, Any]],
     removed_edge_ids: set[tuple[str, str, str | None]],
@@ -978,56 +1059,12 @@ def rewrite_remove_edge_ids_in_pipeline(
     """Drop edge/create_edge steps (and links) targeting removed edge triples."""
     if not removed_edge_ids:
         return deepcopy(pipeline)
-
-    def _rewrite_step(step: dict[str, Any]) -> dict[str, Any] | None:
-        out = deepcopy(step)
-        edge_payload = out.get("edge")
-        if isinstance(edge_payload, dict):
-            if _payload_targets_removed_edge(edge_payload, removed_edge_ids):
-                out.pop("edge", None)
-            else:
-                _prune_relation_map_for_removed_edge_ids(edge_payload, removed_edge_ids)
-                links = edge_payload.get("links")
-                if isinstance(links, list):
-                    edge_payload["links"] = [
-                        link
-                        for link in links
-                        if not (
-                            isinstance(link, dict)
-                            and _payload_targets_removed_edge(link, removed_edge_ids)
-                        )
-                    ]
-        create_edge_payload = out.get("create_edge")
-        if isinstance(create_edge_payload, dict):
-            if _payload_targets_removed_edge(create_edge_payload, removed_edge_ids):
-                out.pop("create_edge", None)
-            else:
-                _prune_relation_map_for_removed_edge_ids(
-                    create_edge_payload, removed_edge_ids
-                )
-        descend_payload = out.get("descend")
-        if isinstance(descend_payload, dict) and isinstance(
-            descend_payload.get("pipeline"), list
-        ):
-            descend_payload["pipeline"] = [
-                nested
-                for nested in (
-                    _rewrite_step(item)
-                    for item in descend_payload["pipeline"]
-                    if isinstance(item, dict)
-                )
-                if nested is not None
-            ]
-        if "edge" not in out and "create_edge" not in out and out.get("type") == "edge":
-            return None
-        if not out:
-            return None
-        return out
-
     return [
         rewritten
         for rewritten in (
-            _rewrite_step(step) for step in pipeline if isinstance(step, dict)
+            _remove_edge_ids_in_step(step, removed_edge_ids)
+            for step in pipeline
+            if isinstance(step, dict)
         )
         if rewritten is not None
     ]
@@ -1067,6 +1104,58 @@ def _rewrite_edge_properties_payload(
     payload["properties"] = rewritten
 
 
+def _rewrite_edge_properties_in_edge_payload(
+    payload: dict[str, Any],
+    renames_ctx: dict[str, dict[str, str]],
+    removals_ctx: dict[str, set[str]],
+) -> None:
+    relation = payload.get("relation")
+    if isinstance(relation, str):
+        renames = renames_ctx.get(relation, {})
+        removals = removals_ctx.get(relation, set())
+    else:
+        renames = {}
+        removals = set()
+    _rewrite_edge_properties_payload(payload, renames=renames, removals=removals)
+    links = payload.get("links")
+    if isinstance(links, list):
+        for link in links:
+            if not isinstance(link, dict):
+                continue
+            link_relation = link.get("relation")
+            _rewrite_edge_properties_payload(
+                link,
+                renames=renames_ctx.get(link_relation, {})
+                if isinstance(link_relation, str)
+                else {},
+                removals=removals_ctx.get(link_relation, set())
+                if isinstance(link_relation, str)
+                else set(),
+            )
+
+
+def _rewrite_edge_properties_in_step(
+    step: dict[str, Any],
+    renames_ctx: dict[str, dict[str, str]],
+    removals_ctx: dict[str, set[str]],
+) -> dict[str, Any]:
+    out = deepcopy(step)
+    for key in ("edge", "create_edge"):
+        payload = out.get(key)
+        if isinstance(payload, dict):
+            _rewrite_edge_properties_in_edge_payload(payload, renames_ctx, removals_ctx)
+    descend_payload = out.get("descend")
+    if isinstance(descend_payload, dict):
+        nested_pipeline = descend_payload.get("pipeline")
+        if isinstance(nested_pipeline, list):
+            descend_payload["pipeline"] = [
+                _rewrite_edge_properties_in_step(item, renames_ctx, removals_ctx)
+                for item in nested_pipeline
+                if isinstance(item, dict)
+            ]
+    return out
+
+
 def rewrite_edge_properties_in_pipeline(
     pipeline: list[dict[str, Any]],
     *,
@@ -1078,57 +1167,24 @@ def rewrite_edge_properties_in_pipeline(
     removals_ctx = removals_by_relation or {}
     if not renames_ctx and not removals_ctx:
         return deepcopy(pipeline)
-
-    def _rewrite_edge_payload(payload: dict[str, Any]) -> None:
-        relation = payload.get("relation")
-        if isinstance(relation, str):
-            renames = renames_ctx.get(relation, {})
-            removals = removals_ctx.get(relation, set())
-        else:
-            renames = {}
-            removals = set()
-        _rewrite_edge_properties_payload(payload, renames=renames, removals=removals)
-        links = payload.get("links")
-        if isinstance(links, list):
-            for link in links:
-                if not isinstance(link, dict):
-                    continue
-                link_relation = link.get("relation")
-                _rewrite_edge_properties_payload(
-                    link,
-                    renames=renames_ctx.get(link_relation, {})
-                    if isinstance(link_relation, str)
-                    else {},
-                    removals=removals_ctx.get(link_relation, set())
-                    if isinstance(link_relation, str)
-                    else set(),
-                )
-
-    def _rewrite_step(step: dict[str, Any]) -> dict[str, Any]:
-        out = deepcopy(step)
-        for key in ("edge", "create_edge"):
-            payload = out.get(key)
-            if isinstance(payload, dict):
-                _rewrite_edge_payload(payload)
-        descend_payload = out.get("descend")
-        if isinstance(descend_payload, dict):
-            nested_pipeline = descend_payload.get("pipeline")
-            if isinstance(nested_pipeline, list):
-                descend_payload["pipeline"] = [
-                    _rewrite_step(item)
-                    for item in nested_pipeline
-                    if isinstance(item, dict)
-                ]
-        return out
-
-    return [_rewrite_step(step) for step in pipeline if isinstance(step, dict)]
+    return [
+        _rewrite_edge_properties_in_step(step, renames_ctx, removals_ctx)
+        for step in pipeline
+        if isinstance(step, dict)
+    ]
 
 
 def pipeline_mentions_any_vertex(steps: list[dict[str, Any]], names: set[str]) -> bool:
-    """Return True if any pipeline step references a vertex name in *names*."""
+    """Return True if any pipeline step references a vertex name in *names*.
+
+    Walks nested ``descend`` pipelines with an explicit stack and stops at the
+    first match.
+    """
     if not names:
         return False
-    for step in steps:
+    stack: list[Any] = list(reversed(steps))
+    while stack:
+        step = stack.pop()
         if not isinstance(step, dict):
             continue
         s = normalize_actor_step(dict(step))
@@ -1150,8 +1206,6 @@ def pipeline_mentions_any_vertex(steps: list[dict[str, Any]], names: set[str]) -
                     return True
         elif t == "descend":
             pl = s.get("pipeline") or []
-            if isinstance(pl, list) and pipeline_mentions_any_vertex(
-                [cast_step(x) for x in pl if isinstance(x, dict)], names
-            ):
-                return True
+            if isinstance(pl, list):
+                stack.extend(reversed(pl))
     return False
@@ -13,10 +13,13 @@ The actual mutation lives in
 from __future__ import annotations
 
 import logging
-from collections import Counter
+from collections import defaultdict
+from collections.abc import Set as AbstractSet
+from functools import lru_cache
 
 from graflo.architecture.schema import Schema
 from graflo.architecture.schema.edge import Edge
+from graflo.architecture.schema.vertex import Field, Vertex
 from graflo.onto import DBType
 
 logger = logging.getLogger(__name__)
@@ -24,11 +27,15 @@ logger = logging.getLogger(__name__)
 
 def _vertex_field_sanitizer(
     schema: Schema,
-    reserved_words: set[str],
+    reserved_words: AbstractSet[str],
     *,
     db_flavor: DBType | None = None,
 ):
-    """Return ``(sanitize, should_run)`` for vertex property name sanitization."""
+    """Return ``(sanitize, should_run)`` for vertex property name sanitization.
+
+    The returned callable is memoized per field name: wide schemas repeat the
+    same property names (``id``, ``name``, ...) across many vertices.
+    """
     from graflo.db.util import (
         load_tigergraph_identifier_rules,
         sanitize_attribute_name,
@@ -42,10 +49,12 @@ def _vertex_field_sanitizer(
             if not reserved_words:
                 return None, False
             return (
-                lambda name: sanitize_attribute_name(name, reserved_words),
+                lru_cache(maxsize=None)(
+                    lambda name: sanitize_attribute_name(name, reserved_words)
+                ),
                 True,
             )
-        effective_reserved = reserved_words or set(rules.reserved_words_upper)
+        effective_reserved = reserved_words or rules.reserved_words_upper
 
         def sanitize(name: str) -> str:
             return sanitize_tigergraph_identifier(
@@ -55,17 +64,22 @@ def _vertex_field_sanitizer(
                 rules.invalid_characters,
             )
 
-        return sanitize, True
+        return lru_cache(maxsize=None)(sanitize), True
 
     if not reserved_words:
         return None, False
 
-    return (lambda name: sanitize_attribute_name(name, reserved_words), True)
+    return (
+        lru_cache(maxsize=None)(
+            lambda name: sanitize_attribute_name(name, reserved_words)
+        ),
+        True,
+    )
 
 
 def compute_vertex_field_renames(
     schema: Schema,
-    reserved_words: set[str],
+    reserved_words: AbstractSet[str],
     *,
     db_flavor: DBType | None = None,
 ) -> dict[str, dict[str, str]]:
@@ -102,6 +116,8 @@ def _normalize_role_indexes(
     renames: dict[str, dict[str, str]],
     relation: str | None,
     role: str,
+    identity_by_vertex: dict[str, tuple[str, ...]],
+    vertex_by_name: dict[str, Vertex],
 ) -> None:
     """Update ``renames`` and ``schema`` so vertices share a common index for *role*.
 
@@ -112,8 +128,11 @@ def _normalize_role_indexes(
        and merge it into ``renames[vertex_name]``.
     3. Update the in-memory schema to reflect the new identity (rewrite
        ``vertex.identity`` and ``vertex.properties``).
+
+    ``identity_by_vertex`` is the caller's identity lookup; it is kept in sync
+    with every identity rewritten here so later relation groups see it.
+    ``vertex_by_name`` is the caller's precomputed name -> vertex map.
     """
-    from graflo.architecture.schema.vertex import Field
 
     if not vertex_indexes:
         return
@@ -123,11 +142,14 @@ def _normalize_role_indexes(
         if vertex_name not in vertex_index_dict:
             vertex_index_dict[vertex_name] = index_fields
 
-    indexes_list = list(vertex_index_dict.values())
-    if len(set(indexes_list)) == 1:
+    counts: dict[tuple[str, ...], int] = {}
+    for index_fields in vertex_index_dict.values():
+        counts[index_fields] = counts.get(index_fields, 0) + 1
+    if len(counts) == 1:
         return
 
-    most_popular_index = Counter(indexes_list).most_common(1)[0][0]
+    # First-seen wins on ties, matching Counter.most_common(1).
+    most_popular_index = max(counts, key=counts.__getitem__)
 
     for vertex_name, index_fields in vertex_index_dict.items():
         if index_fields == most_popular_index:
@@ -144,7 +166,7 @@ def _normalize_role_indexes(
         elif old_fields and new_fields and old_fields[0] != new_fields[0]:
             per_vertex[old_fields[0]] = new_fields[0]
 
-        vertex = schema.core_schema.vertex_config[vertex_name]
+        vertex = vertex_by_name[vertex_name]
 
         # Walk existing properties and apply per_vertex rename map, preserving
         # types and descriptions. This mirrors _rename_fields_in_schema and
@@ -177,6 +199,7 @@ def _normalize_role_indexes(
         # and re-add the old identity field names as type=None ghosts.
         vertex.identity = list(most_popular_index)
         vertex.properties = new_properties
+        identity_by_vertex[vertex_name] = tuple(vertex.identity)
 
         logger.debug(
             "Normalizing %s index for vertex '%s' in relation '%s': %s -> %s",
@@ -204,7 +227,7 @@ def normalize_relation_identity(
     if db_flavor != DBType.TIGERGRAPH:
         return field_renames
 
-    edges_by_relation: dict[str | None, list[Edge]] = {}
+    edges_by_relation: defaultdict[str | None, list[Edge]] = defaultdict(list)
     for edge in schema.core_schema.edge_config.edges:
         relation = (
             schema.db_profile.edge_relation_name(
@@ -213,31 +236,25 @@ def normalize_relation_identity(
             )
             or edge.relation
         )
-        edges_by_relation.setdefault(relation, []).append(edge)
+        edges_by_relation[relation].append(edge)
+
+    vertex_by_name: dict[str, Vertex] = {
+        vertex.name: vertex for vertex in schema.core_schema.vertex_config.vertices
+    }
+    identity_by_vertex: dict[str, tuple[str, ...]] = {
+        name: tuple(vertex.identity) for name, vertex in vertex_by_name.items()
+    }
 
     for relation, relation_edges in edges_by_relation.items():
         if len(relation_edges) <= 1:
             continue
 
-        source_indexes: list[tuple[str, tuple[str, ...]]] = []
-        target_indexes: list[tuple[str, tuple[str, ...]]] = []
-        for edge in relation_edges:
-            source_indexes.append(
-                (
-                    edge.source,
-                    tuple(
-                        schema.core_schema.vertex_config.identity_fields(edge.source)
-                    ),
-                )
-            )
-            target_indexes.append(
-                (
-                    edge.target,
-                    tuple(
-                        schema.core_schema.vertex_config.identity_fields(edge.target)
-                    ),
-                )
-            )
+        source_indexes: list[tuple[str, tuple[str, ...]]] = [
+            (edge.source, identity_by_vertex[edge.source]) for edge in relation_edges
+        ]
+        target_indexes: list[tuple[str, tuple[str, ...]]] = [
+            (edge.target, identity_by_vertex[edge.target]) for edge in relation_edges
+        ]
 
         _normalize_role_indexes(
             source_indexes,
@@ -245,6 +262,8 @@ def normalize_relation_identity(
             field_renames,
             relation,
             role="source",
+            identity_by_vertex=identity_by_vertex,
+            vertex_by_name=vertex_by_name,
         )
         _normalize_role_indexes(
             target_indexes,
@@ -252,6 +271,8 @@ def normalize_relation_identity(
             field_renames,
             relation,
             role="target",
+            identity_by_vertex=identity_by_vertex,
+            vertex_by_name=vertex_by_name,
         )
 
     return field_renames
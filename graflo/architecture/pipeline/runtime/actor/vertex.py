@@ -14,7 +14,6 @@ from graflo.architecture.graph_types import (
 )
 from graflo.architecture.graph_types.merge import merge_doc_basis
 from graflo.architecture.schema.vertex import VertexConfig, VertexName
-from graflo.onto import ExpressionFlavor
 
 from .base import ActorConstants, ActorInitContext, VertexProducingActor
 
@@ -57,12 +56,11 @@ class VertexActor(VertexProducingActor):
     def _filter_and_aggregate_vertex_docs(
         self, docs: list[dict[str, Any]], doc: dict[str, Any]
     ) -> list[dict[str, Any]]:
-        filters = self.vertex_config.filters(self.name)
-        return [
-            _doc
-            for _doc in docs
-            if all(cfilter(kind=ExpressionFlavor.PYTHON, **_doc) for cfilter in filters)
+        predicates = [
+            cfilter.compile_python()
+            for cfilter in self.vertex_config.filters(self.name)
         ]
+        return [_doc for _doc in docs if all(p(_doc) for p in predicates)]
 
     def _extract_vertex_doc_from_transformed_item(
         self,
@@ -76,6 +76,15 @@ def filter_vertex_config_for_resource(
     )
 
 
+def _static_edge_ids(root: ActorWrapper) -> set[EdgeId]:
+    """Collect (source, target, None) for every static EdgeActor under *root*."""
+    return {
+        (actor.edge.source, actor.edge.target, None)
+        for actor in root.collect_actors()
+        if isinstance(actor, EdgeActor) and actor.edge is not None
+    }
+
+
 class ResourceRuntime:
     """Fully initialized resource executor for document casting."""
 
@@ -98,6 +107,10 @@ class ResourceRuntime:
         self._type_casters = resolve_type_casters(config.types)
         self._root = ActorWrapper(*config.pipeline)
         self._executor = ActorExecutor(self._root)
+        # Derived once from the pre-init actor tree and config; validation, config
+        # filtering and infer-edge setup all read these instead of re-walking.
+        self._vertex_names = config.collect_vertex_names()
+        self._pipeline_edge_ids = _static_edge_ids(self._root)
 
         runtime_vertex_config, local_edge_config = self._filter_vertex_edge_configs(
             vertex_config,
@@ -167,7 +180,7 @@ class ResourceRuntime:
         return self._type_casters
 
     def collect_vertex_names(self) -> set[str]:
-        return self.config.collect_vertex_names()
+        return set(self._vertex_names)
 
     def count(self) -> int:
         return self._root.count()
@@ -175,13 +188,7 @@ class ResourceRuntime:
     @staticmethod
     def edge_ids_from_pipeline(pipeline: list[dict[str, Any]]) -> set[EdgeId]:
         """Collect (source, target, None) for every static EdgeActor in *pipeline*."""
-        root = ActorWrapper(*pipeline)
-        edge_actors = [a for a in root.collect_actors() if isinstance(a, EdgeActor)]
-        return {
-            (ea.edge.source, ea.edge.target, None)
-            for ea in edge_actors
-            if ea.edge is not None
-        }
+        return _static_edge_ids(ActorWrapper(*pipeline))
 
     def _filter_vertex_edge_configs(
         self,
@@ -192,7 +199,7 @@ class ResourceRuntime:
     ) -> tuple[VertexConfig, EdgeConfig]:
         runtime_vertex_config = filter_vertex_config_for_resource(
             vertex_config,
-            resource_vertex_names=self.collect_vertex_names(),
+            resource_vertex_names=self._vertex_names,
             allowed_vertex_names=allowed_vertex_names,
         )
         local_edge_config = EdgeConfig.model_validate(
@@ -210,7 +217,7 @@ class ResourceRuntime:
             # dropped by filter_vertex_config_for_resource, so a pipeline that
             # writes nothing validates clean. Under strict references that is an
             # error: the resource claims to produce a vertex the schema lacks.
-            undeclared = sorted(self.collect_vertex_names() - known_vertices)
+            undeclared = sorted(self._vertex_names - known_vertices)
             if undeclared:
                 raise ValueError(
                     f"Resource '{self.config.name}' pipeline references undefined "
@@ -227,7 +234,7 @@ class ResourceRuntime:
         for spec in self.config.infer_edge_except:
             referenced_vertices.add(spec.source)
             referenced_vertices.add(spec.target)
-        for source, target, _ in self.edge_ids_from_pipeline(self.config.pipeline):
+        for source, target, _ in self._pipeline_edge_ids:
             referenced_vertices.add(source)
             referenced_vertices.add(target)
 
@@ -258,7 +265,7 @@ class ResourceRuntime:
     def _build_infer_except(self) -> set[EdgeId]:
         infer_edge_except = {spec.edge_id for spec in self.config.infer_edge_except}
         if not self.config.infer_edge_only:
-            infer_edge_except |= self.edge_ids_from_pipeline(self.config.pipeline)
+            infer_edge_except |= self._pipeline_edge_ids
         return infer_edge_except
 
     def _build_init_context(
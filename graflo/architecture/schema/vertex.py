@@ -827,6 +827,7 @@ class VertexConfig(ConfigBaseModel):
         ),
     )
     _vertices_map: dict[VertexName, Vertex] | None = PrivateAttr(default=None)
+    _vertex_set: frozenset[VertexName] | None = PrivateAttr(default=None)
     _vertex_numeric_fields_map: dict[VertexName, object] | None = PrivateAttr(
         default=None
     )
@@ -849,6 +850,7 @@ class VertexConfig(ConfigBaseModel):
             "_vertices_map",
             {item.name: item for item in self.vertices},
         )
+        object.__setattr__(self, "_vertex_set", None)
         object.__setattr__(self, "_vertex_numeric_fields_map", {})
         self._normalize_vertex_identities()
         return self
@@ -928,13 +930,20 @@ class VertexConfig(ConfigBaseModel):
         return self._vertices_map
 
     @property
-    def vertex_set(self):
+    def vertex_set(self) -> frozenset[VertexName]:
         """Get set of vertex names.
 
+        Cached until the name map changes; membership checks on this run per
+        document in the edge and router actors.
+
         Returns:
-            set[str]: Set of vertex names
+            frozenset[str]: Set of vertex names
         """
-        return set(self._get_vertices_map().keys())
+        vertex_set = self._vertex_set
+        if vertex_set is None:
+            vertex_set = frozenset(self._get_vertices_map())
+            object.__setattr__(self, "_vertex_set", vertex_set)
+        return vertex_set
 
     @property
     def vertex_list(self):
@@ -1066,6 +1075,7 @@ class VertexConfig(ConfigBaseModel):
         m = self._get_vertices_map()
         for n in names:
             m.pop(n, None)
+        object.__setattr__(self, "_vertex_set", None)
 
     def update_vertex(self, v: Vertex):
         """Update vertex configuration.
@@ -1074,6 +1084,7 @@ class VertexConfig(ConfigBaseModel):
             v: Vertex configuration to update
         """
         self._get_vertices_map()[v.name] = v
+        object.__setattr__(self, "_vertex_set", None)
 
     def __getitem__(self, key: str):
         """Get vertex configuration by name.
@@ -1101,6 +1112,7 @@ class VertexConfig(ConfigBaseModel):
             value: Vertex configuration
         """
         self._get_vertices_map()[key] = value
+        object.__setattr__(self, "_vertex_set", None)
 
     def finish_init(self):
         """Complete logical initialization of vertices."""
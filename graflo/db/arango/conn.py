@@ -371,7 +371,7 @@ class ArangoConnection(Connection):
             for c in collections_result:
                 if isinstance(c, dict):
                     name_value = cast(dict[str, Any], c).get("name")
-                    if isinstance(name_value, str) and name_value[0] != "_":
+                    if isinstance(name_value, str) and not name_value.startswith("_"):
                         non_system.append(name_value)
         return has_graphs or len(non_system) > 0
 
@@ -738,57 +738,45 @@ class ArangoConnection(Connection):
                     return value
             return None
 
+        def _graph_names(graphs_result: Any) -> list[str]:
+            names: list[str] = []
+            if isinstance(graphs_result, list):
+                for g in graphs_result:
+                    name_value = _graph_name(g)
+                    if name_value is not None:
+                        names.append(name_value)
+            return names
+
         cnames: list[str] = list(vertex_types)
         gnames: list[str] = list(graph_names)
         logger.info("vertex/edge classes (non system, ArangoDB collections):")
+        # One listing serves both the log line and ``delete_all``.
         collections_result = self.conn.collections()
+        filtered_collections: list[dict[str, Any]] = []
         if isinstance(collections_result, list):
-            filtered_collections: list[dict[str, Any]] = []
             for c in collections_result:
                 if isinstance(c, dict):
                     c_dict = cast(dict[str, Any], c)
                     name_value = c_dict.get("name")
-                    if isinstance(name_value, str) and name_value[0] != "_":
+                    if isinstance(name_value, str) and not name_value.startswith("_"):
                         filtered_collections.append(c_dict)
-            logger.info(filtered_collections)
-        else:
-            logger.info([])
+        logger.info(filtered_collections)
 
         if delete_all:
-            collections_result = self.conn.collections()
-            graphs_result = self.conn.graphs()
-            cnames = []
-            if isinstance(collections_result, list):
-                for c in collections_result:
-                    if isinstance(c, dict):
-                        c_dict = cast(dict[str, Any], c)
-                        name_value = c_dict.get("name")
-                        if isinstance(name_value, str) and name_value[0] != "_":
-                            cnames.append(name_value)
-            gnames = []
-            if isinstance(graphs_result, list):
-                for g in graphs_result:
-                    name_value = _graph_name(g)
-                    if name_value is not None:
-                        gnames.append(name_value)
+            cnames = [c["name"] for c in filtered_collections]
+            gnames = _graph_names(self.conn.graphs())
 
         # Delete graphs first. Retry because graph metadata can be stale after deletes.
+        # ``ignore_missing`` folds the existence check into the delete request.
         for _ in range(3):
             deleted_any = False
             for gn in gnames:
-                if self.conn.has_graph(gn):
-                    self.conn.delete_graph(gn)
+                if self.conn.delete_graph(gn, ignore_missing=True):
                     deleted_any = True
             if not deleted_any:
                 break
             # Refresh remaining graph names before next pass.
-            refreshed_graphs = self.conn.graphs()
-            gnames = []
-            if isinstance(refreshed_graphs, list):
-                for g in refreshed_graphs:
-                    name_value = _graph_name(g)
-                    if name_value is not None:
-                        gnames.append(name_value)
+            gnames = _graph_names(self.conn.graphs())
 
         logger.info("graphs (after delete operation):")
         logger.info(self.conn.graphs())
@@ -798,10 +786,8 @@ class ArangoConnection(Connection):
         for attempt in range(2):
             blocked = False
             for cn in cnames:
-                if not self.conn.has_collection(cn):
-                    continue
                 try:
-                    self.conn.delete_collection(cn)
+                    self.conn.delete_collection(cn, ignore_missing=True)
                 except Exception as e:
                     if "ERR 1942" in str(e) and attempt == 0:
                         blocked = True
@@ -809,12 +795,8 @@ class ArangoConnection(Connection):
                     raise
             if not blocked:
                 break
-            refreshed_graphs = self.conn.graphs()
-            if isinstance(refreshed_graphs, list):
-                for g in refreshed_graphs:
-                    gn = _graph_name(g)
-                    if gn is not None and self.conn.has_graph(gn):
-                        self.conn.delete_graph(gn)
+            for gn in _graph_names(self.conn.graphs()):
+                self.conn.delete_graph(gn, ignore_missing=True)
 
         logger.info(
             "vertex/edge classes (after delete operation, ArangoDB collections):"
@@ -826,7 +808,7 @@ class ArangoConnection(Connection):
                 if isinstance(c, dict):
                     c_dict = cast(dict[str, Any], c)
                     name_value = c_dict.get("name")
-                    if isinstance(name_value, str) and name_value[0] != "_":
+                    if isinstance(name_value, str) and not name_value.startswith("_"):
                         collection_names.append(name_value)
             logger.info(collection_names)
         else:
@@ -14,8 +14,9 @@ from graflo.architecture.schema.edge import Edge
 from graflo.architecture.schema.vertex import VertexConfig
 from graflo.connections.graflo_backend import GraFloBackendConfig
 from graflo.db.conn import Connection, NamespaceNotFoundError, SchemaExistsError
+from graflo.db.traversal import edge_query_name
 from graflo.filter.onto import FilterExpression, parse_filter_expression
-from graflo.onto import AggregationType, DBType, ExpressionFlavor
+from graflo.onto import AggregationType, DBType
 
 logger = logging.getLogger(__name__)
 
@@ -189,13 +190,17 @@ class GraFloBackendConnection(Connection):
         **kwargs: Any,
     ) -> list[dict[str, Any]]:
         self._sync_for_read()
-        predicate = parse_filter_expression(filters) if filters is not None else None
+        predicate = (
+            parse_filter_expression(filters).compile_python()
+            if filters is not None
+            else None
+        )
 
         def _keep(doc: dict[str, Any]) -> bool:
             if predicate is None:
                 return True
             try:
-                return bool(predicate(kind=ExpressionFlavor.PYTHON, **doc))
+                return bool(predicate(doc))
             except Exception:
                 # A document missing a filtered field simply does not match.
                 return False
@@ -269,10 +274,8 @@ class GraFloBackendConnection(Connection):
                 break
 
         if filters is not None:
-            expression = parse_filter_expression(filters)
-            matched = [
-                row for row in matched if expression(row, kind=ExpressionFlavor.PYTHON)
-            ]
+            predicate = parse_filter_expression(filters).compile_python()
+            matched = [row for row in matched if predicate(row)]
         if return_keys or unset_keys:
             keep = set(return_keys) if return_keys else None
             drop = set(unset_keys) if unset_keys else set()
@@ -300,7 +303,7 @@ class GraFloBackendConnection(Connection):
         index: dict[str, list[dict[str, Any]]] = {}
         total = 0
         for edge in schema.core_schema.edge_config.edges:
-            storage = db_aware.edge_config.runtime(edge).storage_name()
+            storage = edge_query_name(db_aware, edge, self.flavor)
             if storage is None:
                 continue
             rows = index.setdefault(storage, [])
@@ -23,20 +23,55 @@ Example:
     ...     conn.execute("FOR doc IN vertex_class RETURN doc")
 """
 
-from typing import Any, cast
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Iterator, Mapping
+from typing import TYPE_CHECKING, cast
 
 from graflo.connections.onto import TARGET_DATABASES, DBConfig
-from graflo.db.arango.conn import ArangoConnection
 from graflo.db.conn import ConnectionCapability
-from graflo.db.falkordb.conn import FalkordbConnection
-from graflo.db.graflo_backend.connection import GraFloBackendConnection
-from graflo.db.memgraph.conn import MemgraphConnection
-from graflo.db.nebula.conn import NebulaConnection
-from graflo.db.neo4j.conn import Neo4jConnection
-from graflo.db.postgres.conn import PostgresConnection
-from graflo.db.tigergraph.conn import TigerGraphConnection
 from graflo.onto import DBType
 
+if TYPE_CHECKING:
+    from graflo.db.conn import Connection
+
+
+class _LazyConnectionClasses(Mapping[DBType, "type[Connection]"]):
+    """DB type -> connection class, importing each backend on first lookup.
+
+    Every backend module pulls in its driver (``neo4j``, ``arango``, ...), so
+    resolving them lazily keeps ``import graflo.db.manager`` from loading all
+    drivers when a caller only ever opens one kind of connection.
+    """
+
+    def __init__(self, paths: dict[DBType, tuple[str, str]]) -> None:
+        self._paths = paths
+        self._resolved: dict[DBType, type[Connection]] = {}
+
+    def __getitem__(self, db_type: DBType) -> type[Connection]:
+        conn_cls = self._resolved.get(db_type)
+        if conn_cls is None:
+            module_name, class_name = self._paths[db_type]
+            conn_cls = getattr(importlib.import_module(module_name), class_name)
+            self._resolved[db_type] = conn_cls
+        return conn_cls
+
+    def __iter__(self) -> Iterator[DBType]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+def _connection_factory(conn_cls: type[Connection]) -> Callable[..., Connection]:
+    """View *conn_cls* as a constructor taking the backend's ``config``.
+
+    The ``Connection`` base ``__init__`` takes no arguments; every backend
+    subclass accepts its own config type as ``config``.
+    """
+    return cast("Callable[..., Connection]", conn_cls)
+
 
 class ConnectionManager:
     """Manager for database connections (both graph and source databases).
@@ -57,16 +92,21 @@ class ConnectionManager:
     """
 
     # Target database connections (OUTPUT)
-    target_conn_mapping = {
-        DBType.ARANGO: ArangoConnection,
-        DBType.NEO4J: Neo4jConnection,
-        DBType.TIGERGRAPH: TigerGraphConnection,
-        DBType.FALKORDB: FalkordbConnection,
-        DBType.MEMGRAPH: MemgraphConnection,
-        DBType.NEBULA: NebulaConnection,
-        DBType.POSTGRES: PostgresConnection,
-        DBType.GRAFLO_BACKEND: GraFloBackendConnection,
-    }
+    target_conn_mapping: Mapping[DBType, type[Connection]] = _LazyConnectionClasses(
+        {
+            DBType.ARANGO: ("graflo.db.arango.conn", "ArangoConnection"),
+            DBType.NEO4J: ("graflo.db.neo4j.conn", "Neo4jConnection"),
+            DBType.TIGERGRAPH: ("graflo.db.tigergraph.conn", "TigerGraphConnection"),
+            DBType.FALKORDB: ("graflo.db.falkordb.conn", "FalkordbConnection"),
+            DBType.MEMGRAPH: ("graflo.db.memgraph.conn", "MemgraphConnection"),
+            DBType.NEBULA: ("graflo.db.nebula.conn", "NebulaConnection"),
+            DBType.POSTGRES: ("graflo.db.postgres.conn", "PostgresConnection"),
+            DBType.GRAFLO_BACKEND: (
+                "graflo.db.graflo_backend.connection",
+                "GraFloBackendConnection",
+            ),
+        }
+    )
 
     @classmethod
     def flavors_supporting(cls, capability: ConnectionCapability) -> list[DBType]:
@@ -120,7 +160,7 @@ class ConnectionManager:
                 f"Database type {db_type!r} does not support {require.label}. "
                 f"Supported types: {supported}"
             )
-        return conn_cls(config=cast(Any, connection_config))
+        return _connection_factory(conn_cls)(config=connection_config)
 
     def __init__(
         self,
@@ -160,7 +200,7 @@ class ConnectionManager:
             # Work on a copy: the caller's config may be shared across concurrent
             # connection managers, and mutating it here would leak working_db.
             config = config.model_copy(update={"database": self.working_db})
-        self.conn = cls(config=cast(Any, config))
+        self.conn = _connection_factory(cls)(config=config)
         return self.conn
 
     def close(self):
@@ -26,7 +26,8 @@ from __future__ import annotations
 
 import json
 import logging
-from functools import lru_cache
+from collections.abc import Set as AbstractSet
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import NamedTuple
 
@@ -192,19 +193,20 @@ def json_serializer(obj):
     return serialized
 
 
-def load_reserved_words(db_flavor: DBType) -> set[str]:
-    """Load reserved words for a given database flavor.
+@cache
+def load_reserved_words(db_flavor: DBType) -> frozenset[str]:
+    """Load reserved words for a given database flavor (cached per flavor).
 
     Args:
         db_flavor: The database flavor to load reserved words for
 
     Returns:
-        Set of reserved words (uppercase) for the database flavor.
+        Frozen set of reserved words (uppercase) for the database flavor.
         Returns empty set if no reserved words file exists or for unsupported flavors.
     """
     if db_flavor != DBType.TIGERGRAPH:
         # Currently only TigerGraph has reserved words defined
-        return set()
+        return frozenset()
 
     # Load TigerGraph reserved words
     json_path = Path(__file__).parent / "tigergraph" / "reserved_words.json"
@@ -216,13 +218,13 @@ def load_reserved_words(db_flavor: DBType) -> set[str]:
             f"Could not find reserved_words.json at {json_path}, "
             f"no reserved word sanitization will be performed"
         )
-        return set()
+        return frozenset()
     except json.JSONDecodeError as e:
         logger.warning(
             f"Could not parse reserved_words.json: {e}, "
             f"no reserved word sanitization will be performed"
         )
-        return set()
+        return frozenset()
 
     reserved_words = set()
     reserved_words.update(
@@ -233,7 +235,7 @@ def load_reserved_words(db_flavor: DBType) -> set[str]:
     )
 
     # Return uppercase set for case-insensitive comparison
-    return {word.upper() for word in reserved_words}
+    return frozenset(word.upper() for word in reserved_words)
 
 
 @lru_cache(maxsize=1)
@@ -273,21 +275,27 @@ def load_tigergraph_identifier_rules() -> TigerGraphIdentifierRules | None:
     )
 
 
+@lru_cache(maxsize=8)
+def _invalid_character_table(invalid_characters: tuple[str, ...]) -> dict[int, str]:
+    """Build a ``str.translate`` table mapping each invalid character to its replacement."""
+    return {
+        ord(char): TIGERGRAPH_INVALID_CHAR_REPLACEMENT
+        for char in invalid_characters
+        if len(char) == 1
+    }
+
+
 def _replace_invalid_tigergraph_characters(
     name: str, invalid_characters: tuple[str, ...]
 ) -> str:
     if not invalid_characters:
         return name
-    invalid_set = set(invalid_characters)
-    return "".join(
-        TIGERGRAPH_INVALID_CHAR_REPLACEMENT if char in invalid_set else char
-        for char in name
-    )
+    return name.translate(_invalid_character_table(invalid_characters))
 
 
 def sanitize_tigergraph_identifier(
     name: str,
-    reserved_words: set[str],
+    reserved_words: AbstractSet[str],
     forbidden_prefixes: tuple[str, ...],
     invalid_characters: tuple[str, ...],
     suffix: str = "_attr",
@@ -307,7 +315,7 @@ def sanitize_tigergraph_identifier(
 
 
 def sanitize_attribute_name(
-    name: str, reserved_words: set[str], suffix: str = "_attr"
+    name: str, reserved_words: AbstractSet[str], suffix: str = "_attr"
 ) -> str:
     """Sanitize an attribute name to avoid reserved words.
 
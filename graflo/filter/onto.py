@@ -22,10 +22,11 @@ Example:
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Mapping
 from types import MappingProxyType
 from typing import Any, Literal, Self, cast
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 
 from graflo.architecture.base import ConfigBaseModel
 from graflo.onto import BaseEnum, ExpressionFlavor
@@ -120,6 +121,64 @@ CMP_TO_DUNDER: MappingProxyType[ComparisonOperator, str] = MappingProxyType(
 )
 
 
+def _quote_sql_field(field: str) -> str:
+    """Quote a SQL field name, handling dotted alias.column references.
+
+    ``sys_id``   -> ``"sys_id"``
+    ``s.sys_id`` -> ``s."sys_id"``
+    """
+    if "." in field:
+        alias, col = field.split(".", 1)
+        return f'{alias}."{col}"'
+    return f'"{field}"'
+
+
+def _sql_null_check(suffix: str):
+    def render(field: str | None, doc_name: str) -> str:
+        return f"{_quote_sql_field(field)} {suffix}" if field else ""
+
+    return render
+
+
+#: Query renderings of the unary null checks, keyed by ``(operator, flavor)``.
+#: Each renderer takes ``(field, doc_name)``; REST++ (GSQL with an empty
+#: ``doc_name``) and PYTHON evaluation are handled separately.
+_NULL_RENDERERS: MappingProxyType[
+    tuple[ComparisonOperator, ExpressionFlavor], Callable[[str | None, str], str]
+] = MappingProxyType(
+    {
+        (ComparisonOperator.IS_NULL, ExpressionFlavor.AQL): lambda f, d: (
+            f'{d}["{f}"] == null'
+        ),
+        (ComparisonOperator.IS_NOT_NULL, ExpressionFlavor.AQL): lambda f, d: (
+            f'{d}["{f}"] != null'
+        ),
+        (ComparisonOperator.IS_NULL, ExpressionFlavor.CYPHER): lambda f, d: (
+            f"{d}.{f} IS NULL"
+        ),
+        (ComparisonOperator.IS_NOT_NULL, ExpressionFlavor.CYPHER): lambda f, d: (
+            f"{d}.{f} IS NOT NULL"
+        ),
+        (ComparisonOperator.IS_NULL, ExpressionFlavor.NGQL): lambda f, d: (
+            f"{d}.{f} IS EMPTY"
+        ),
+        (ComparisonOperator.IS_NOT_NULL, ExpressionFlavor.NGQL): lambda f, d: (
+            f"{d}.{f} IS NOT EMPTY"
+        ),
+        (ComparisonOperator.IS_NULL, ExpressionFlavor.GSQL): lambda f, d: (
+            f"{d}.{f} IS NULL"
+        ),
+        (ComparisonOperator.IS_NOT_NULL, ExpressionFlavor.GSQL): lambda f, d: (
+            f"{d}.{f} IS NOT NULL"
+        ),
+        (ComparisonOperator.IS_NULL, ExpressionFlavor.SQL): _sql_null_check("IS NULL"),
+        (ComparisonOperator.IS_NOT_NULL, ExpressionFlavor.SQL): _sql_null_check(
+            "IS NOT NULL"
+        ),
+    }
+)
+
+
 class FilterExpression(ConfigBaseModel):
     """Unified filter expression (discriminated: leaf or composite).
 
@@ -140,6 +199,9 @@ class FilterExpression(ConfigBaseModel):
     # Composite fields (used when kind="composite")
     operator: LogicalOperator | None = None  # AND, OR, NOT, IF_THEN
     deps: list[FilterExpression] = Field(default_factory=list)
+    _python_predicate: Callable[[Mapping[str, Any]], bool] | None = PrivateAttr(
+        default=None
+    )
 
     @field_validator("value", mode="before")
     @classmethod
@@ -196,7 +258,8 @@ class FilterExpression(ConfigBaseModel):
             if self.operator is not None or self.deps:
                 raise ValueError("leaf expression must not have operator or deps")
             # IS_NULL / IS_NOT_NULL are unary; clear any spurious value list
-            if self.cmp_operator in (
+            # (the common case already has an empty one, so leave it in place).
+            if self.value and self.cmp_operator in (
                 ComparisonOperator.IS_NULL,
                 ComparisonOperator.IS_NOT_NULL,
             ):
@@ -204,6 +267,7 @@ class FilterExpression(ConfigBaseModel):
         else:
             if self.operator is None:
                 raise ValueError("composite expression must have operator")
+        object.__setattr__(self, "_python_predicate", None)
         return self
 
     @field_validator("deps", mode="before")
@@ -279,6 +343,77 @@ class FilterExpression(ConfigBaseModel):
             return self._call_leaf(doc_name=doc_name, kind=kind, **kwargs)
         return self._call_composite(doc_name=doc_name, kind=kind, **kwargs)
 
+    def compile_python(self) -> Callable[[Mapping[str, Any]], bool]:
+        """Return a predicate evaluating this expression against one document.
+
+        Equivalent to ``self(kind=ExpressionFlavor.PYTHON, **doc)`` but resolves
+        operators once instead of on every call, so filtering many documents
+        does not re-dispatch per row. The predicate is cached and rebuilt after
+        a field is reassigned.
+        """
+        if self._python_predicate is None:
+            if self.kind == "leaf":
+                predicate = self._compile_python_leaf()
+            else:
+                predicate = self._compile_python_composite()
+            object.__setattr__(self, "_python_predicate", predicate)
+        return cast(Callable[[Mapping[str, Any]], bool], self._python_predicate)
+
+    def _compile_python_leaf(self) -> Callable[[Mapping[str, Any]], bool]:
+        field = self.field
+        if field is None:
+            return lambda doc: False
+        if self.cmp_operator == ComparisonOperator.IS_NULL:
+            return lambda doc: doc.get(field) is None
+        if self.cmp_operator == ComparisonOperator.IS_NOT_NULL:
+            return lambda doc: doc.get(field) is not None
+        # ``value`` is read per call: it is a list and may be changed in place
+        # without going through assignment validation.
+        if self.cmp_operator == ComparisonOperator.IN:
+
+            def is_member(doc: Mapping[str, Any]) -> bool:
+                field_val = doc.get(field)
+                return field_val is not None and field_val in self.value
+
+            return is_member
+        dunder = self.unary_op
+        if dunder is None and self.cmp_operator is not None:
+            dunder = CMP_TO_DUNDER.get(self.cmp_operator)
+        if dunder is None:
+            return lambda doc: False
+
+        def compare(doc: Mapping[str, Any]) -> bool:
+            if not self.value:
+                return False
+            operand = self.value[0]
+            field_val = doc.get(field)
+            if field_val is None:
+                return False
+            comparison = getattr(field_val, dunder, None)
+            if comparison is None:
+                return False
+            return comparison(operand) is True
+
+        return compare
+
+    def _compile_python_composite(self) -> Callable[[Mapping[str, Any]], bool]:
+        operator = self.operator
+        deps = self.deps
+        if operator is None or (len(deps) == 1 and operator != LogicalOperator.NOT):
+            # Malformed shapes fail on evaluation, as they do through __call__.
+            def reject(doc: Mapping[str, Any]) -> bool:
+                return bool(self._cast_python_composite(ExpressionFlavor.PYTHON, **doc))
+
+            return reject
+        # Dependencies are looked up per call so reassigning a nested
+        # expression is picked up without rebuilding this predicate.
+        if len(deps) == 1:
+            return lambda doc: not deps[0].compile_python()(doc)
+        if operator == LogicalOperator.IMPLICATION:
+            return lambda doc: implication([d.compile_python()(doc) for d in deps])
+        combine = OperatorMapping[operator]
+        return lambda doc: combine(d.compile_python()(doc) for d in deps)
+
     def _is_null_operator(self) -> bool:
         """Check if this is a null-checking operator (IS_NULL or IS_NOT_NULL)."""
         return self.cmp_operator in (
@@ -298,21 +433,25 @@ class FilterExpression(ConfigBaseModel):
             raise ValueError(
                 "leaf expression requires cmp_operator for non-PYTHON flavor"
             )
+        if kind == ExpressionFlavor.PYTHON:
+            return self._cast_python(**kwargs)
+        if kind == ExpressionFlavor.GSQL and doc_name == "":
+            field_types = kwargs.get("field_types")
+            return self._cast_restpp(field_types=field_types)
+        if self.cmp_operator is not None and self._is_null_operator():
+            renderer = _NULL_RENDERERS.get((self.cmp_operator, kind))
+            if renderer is not None:
+                return renderer(self.field, doc_name)
         if kind == ExpressionFlavor.AQL:
             return self._cast_arango(doc_name)
-        elif kind == ExpressionFlavor.CYPHER:
+        if kind == ExpressionFlavor.CYPHER:
             return self._cast_cypher(doc_name)
-        elif kind == ExpressionFlavor.NGQL:
+        if kind == ExpressionFlavor.NGQL:
             return self._cast_ngql(doc_name)
-        elif kind == ExpressionFlavor.GSQL:
-            if doc_name == "":
-                field_types = kwargs.get("field_types")
-                return self._cast_restpp(field_types=field_types)
+        if kind == ExpressionFlavor.GSQL:
             return self._cast_tigergraph(doc_name)
-        elif kind == ExpressionFlavor.SQL:
+        if kind == ExpressionFlavor.SQL:
             return self._cast_sql()
-        elif kind == ExpressionFlavor.PYTHON:
-            return self._cast_python(**kwargs)
         raise ValueError(f"kind {kind} not implemented")
 
     def _call_composite(
@@ -346,10 +485,6 @@ class FilterExpression(ConfigBaseModel):
         return value
 
     def _cast_arango(self, doc_name: str) -> str:
-        if self.cmp_operator == ComparisonOperator.IS_NULL:
-            return f'{doc_name}["{self.field}"] == null'
-        if self.cmp_operator == ComparisonOperator.IS_NOT_NULL:
-            return f'{doc_name}["{self.field}"] != null'
         const = self._cast_value()
         lemma = f"{self.cmp_operator} {const}"
         if self.unary_op is not None:
@@ -359,10 +494,6 @@ class FilterExpression(ConfigBaseModel):
         return lemma
 
     def _cast_cypher(self, doc_name: str) -> str:
-        if self.cmp_operator == ComparisonOperator.IS_NULL:
-            return f"{doc_name}.{self.field} IS NULL"
-        if self.cmp_operator == ComparisonOperator.IS_NOT_NULL:
-            return f"{doc_name}.{self.field} IS NOT NULL"
         const = self._cast_value()
         cmp_op = (
             "=" if self.cmp_operator == ComparisonOperator.EQ else self.cmp_operator
@@ -381,10 +512,6 @@ class FilterExpression(ConfigBaseModel):
         The caller passes *doc_name* as ``"v.TagName"`` so property access becomes
         ``v.TagName.field``.
         """
-        if self.cmp_operator == ComparisonOperator.IS_NULL:
-            return f"{doc_name}.{self.field} IS EMPTY"
-        if self.cmp_operator == ComparisonOperator.IS_NOT_NULL:
-            return f"{doc_name}.{self.field} IS NOT EMPTY"
         const = self._cast_value()
         lemma = f"{self.cmp_operator} {const}"
         if self.unary_op is not None:
@@ -394,10 +521,6 @@ class FilterExpression(ConfigBaseModel):
         return lemma
 
     def _cast_tigergraph(self, doc_name: str) -> str:
-        if self.cmp_operator == ComparisonOperator.IS_NULL:
-            return f"{doc_name}.{self.field} IS NULL"
-        if self.cmp_operator == ComparisonOperator.IS_NOT_NULL:
-            return f"{doc_name}.{self.field} IS NOT NULL"
         const = self._cast_value()
         cmp_op = (
             "==" if self.cmp_operator == ComparisonOperator.EQ else self.cmp_operator
@@ -409,27 +532,11 @@ class FilterExpression(ConfigBaseModel):
             lemma = f"{doc_name}.{self.field} {lemma}"
         return lemma
 
-    @staticmethod
-    def _quote_sql_field(field: str) -> str:
-        """Quote a SQL field name, handling dotted alias.column references.
-
-        ``sys_id``   -> ``"sys_id"``
-        ``s.sys_id`` -> ``s."sys_id"``
-        """
-        if "." in field:
-            alias, col = field.split(".", 1)
-            return f'{alias}."{col}"'
-        return f'"{field}"'
-
     def _cast_sql(self) -> str:
         """Render leaf as SQL WHERE fragment: \"column\" op value (strings/dates single-quoted)."""
         if not self.field:
             return ""
-        quoted = self._quote_sql_field(self.field)
-        if self.cmp_operator == ComparisonOperator.IS_NULL:
-            return f"{quoted} IS NULL"
-        if self.cmp_operator == ComparisonOperator.IS_NOT_NULL:
-            return f"{quoted} IS NOT NULL"
+        quoted = _quote_sql_field(self.field)
         if self.cmp_operator == ComparisonOperator.EQ:
             op_str = "="
         elif self.cmp_operator == ComparisonOperator.NEQ:
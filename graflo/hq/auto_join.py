@@ -2,9 +2,9 @@
 
 When a Resource's pipeline contains an EdgeActor whose ``derivation`` declares
 ``match_source`` / ``match_target``, and the source/target vertex types
-have known table connectors, this module can auto-generate JoinClauses and
-IS_NOT_NULL filters on the edge resource's table connector so that the
-resulting SQL fetches fully resolved rows.
+have known table connectors, this module can auto-generate JoinClauses on the
+edge resource's table connector so that the resulting SQL fetches fully
+resolved rows.
 """
 
 from __future__ import annotations
@@ -16,7 +16,6 @@ from graflo.architecture.contract.bindings import TableConnector
 from graflo.architecture.contract.ingestion.resource import ResourceConfig
 from graflo.architecture.pipeline.runtime.actor import ActorWrapper, EdgeActor
 from graflo.architecture.pipeline.runtime.resource import ResourceRuntime
-from graflo.filter.onto import ComparisonOperator, FilterExpression
 from graflo.filter.select import JoinClause
 
 if TYPE_CHECKING:
@@ -36,12 +35,13 @@ def enrich_edge_connector_with_joins(
     bindings: Bindings,
     vertex_config: VertexConfig,
 ) -> None:
-    """Mutate *connector* in-place, adding JoinClauses + IS_NOT_NULL filters.
+    """Mutate *connector* in-place, adding JoinClauses for edge endpoints.
 
     The function inspects the Resource's actor pipeline for EdgeActors and,
     for each edge that declares ``match_source`` **and** ``match_target``,
     looks up the source / target vertex table connectors and primary keys to
-    construct LEFT JOINs and NOT-NULL guards.
+    construct INNER JOINs, so rows whose endpoints do not resolve are dropped
+    by the join itself.
 
     If the connector already has joins, this function is a no-op (the user
     provided explicit join specs).
@@ -61,7 +61,9 @@ def enrich_edge_connector_with_joins(
         return
 
     new_joins: list[JoinClause] = []
-    new_filters: list[FilterExpression] = []
+    # Edge steps sharing an endpoint column yield the same join; emitting it
+    # twice would duplicate the alias in the generated SQL.
+    seen_joins: set[tuple[str, str | None, str, str, str]] = set()
 
     for ea in edge_actors:
         edge = ea.edge
@@ -89,45 +91,26 @@ def enrich_edge_connector_with_joins(
         src_alias = _SOURCE_ALIAS
         tgt_alias = _TARGET_ALIAS
 
-        new_joins.append(
-            JoinClause(
-                table=src_table,
-                schema_name=src_schema,
-                alias=src_alias,
-                on_self=der.match_source,
-                on_other=src_pk,
-                join_type="LEFT",
-            )
-        )
-        new_joins.append(
-            JoinClause(
-                table=tgt_table,
-                schema_name=tgt_schema,
-                alias=tgt_alias,
-                on_self=der.match_target,
-                on_other=tgt_pk,
-                join_type="LEFT",
-            )
-        )
-
-        new_filters.append(
-            FilterExpression(
-                kind="leaf",
-                field=f"{src_alias}.{src_pk}",
-                cmp_operator=ComparisonOperator.IS_NOT_NULL,
-            )
-        )
-        new_filters.append(
-            FilterExpression(
-                kind="leaf",
-                field=f"{tgt_alias}.{tgt_pk}",
-                cmp_operator=ComparisonOperator.IS_NOT_NULL,
-            )
-        )
+        for alias, table, schema_name, on_self, pk in (
+            (src_alias, src_table, src_schema, der.match_source, src_pk),
+            (tgt_alias, tgt_table, tgt_schema, der.match_target, tgt_pk),
+        ):
+            join_key = (table, schema_name, alias, on_self, pk)
+            if join_key not in seen_joins:
+                seen_joins.add(join_key)
+                new_joins.append(
+                    JoinClause(
+                        table=table,
+                        schema_name=schema_name,
+                        alias=alias,
+                        on_self=on_self,
+                        on_other=pk,
+                        join_type="INNER",
+                    )
+                )
 
     if new_joins:
         connector.joins = new_joins
-        connector.filters = list(connector.filters) + new_filters
 
 
 # ------------------------------------------------------------------
@@ -27,6 +27,7 @@ from typing import Any, cast
 
 from graflo.architecture.contract.bindings import (
     Bindings,
+    ResourceConnectorBinding,
     SparqlConnector,
 )
 from graflo.architecture.contract.ingestion import IngestionModel
@@ -286,16 +287,28 @@ class RdfInferenceManager:
             ):
                 classes[name] = uri_str
 
-        bindings = Bindings()
+        # Build the whole wiring up front and validate it once: per-class
+        # add_connector/bind_resource calls re-index the bindings every time.
+        # Connector names default to the class URI, as add_connector would set.
+        rdf_file = Path(source) if not endpoint_url else None
+        connectors: list[SparqlConnector] = []
+        resource_connector: list[ResourceConnectorBinding] = []
         for cls_name, cls_uri in classes.items():
-            connector = SparqlConnector(
-                rdf_class=cls_uri,
-                endpoint_url=endpoint_url,
-                graph_uri=graph_uri,
-                rdf_file=Path(source) if not endpoint_url else None,
+            connectors.append(
+                SparqlConnector(
+                    name=cls_uri,
+                    rdf_class=cls_uri,
+                    endpoint_url=endpoint_url,
+                    graph_uri=graph_uri,
+                    rdf_file=rdf_file,
+                )
+            )
+            resource_connector.append(
+                ResourceConnectorBinding(resource=cls_name, connector=cls_uri)
             )
-            bindings.add_connector(connector)
-            bindings.bind_resource(cls_name, connector)
+        bindings = Bindings(
+            connectors=connectors, resource_connector=resource_connector
+        )
 
         logger.info(
             "Created %d SPARQL connectors from ontology",
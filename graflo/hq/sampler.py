@@ -16,7 +16,6 @@ for the derived typed view.
 from __future__ import annotations
 
 import logging
-import re
 from datetime import date, datetime, time
 from decimal import Decimal
 from pathlib import Path
@@ -156,16 +155,12 @@ class ResourceSampler:
     ) -> ResourceSample:
         """Sample a single file, recording the connector that would read it."""
         path = Path(path)
-        connector = FileConnector(
-            name=connector_name or path.stem,
-            regex=f"^{re.escape(path.name)}$",
-            sub_path=path.parent,
-        )
+        # Samples record the connector name only; no FileConnector is built.
         data_source = DataSourceFactory.create_file_data_source(path=path)
         docs, truncated = self._read_data_source(data_source)
         return ResourceSample(
             resource_name=resource_name or path.stem,
-            connector=connector.name,
+            connector=connector_name or path.stem,
             docs=docs,
             truncated=truncated,
             description=f"Sampled from file {path.name}",
@@ -246,11 +241,6 @@ class ResourceSampler:
             for table in introspection.raw_tables:
                 if tables is not None and table.name not in tables:
                     continue
-                connector = TableConnector(
-                    name=table.name,
-                    table_name=table.name,
-                    schema_name=table.schema_name,
-                )
                 rows = conn.get_table_sample_rows(
                     table.name, schema_name=table.schema_name, limit=self.max_docs
                 )
@@ -258,7 +248,7 @@ class ResourceSampler:
                 samples.append(
                     ResourceSample(
                         resource_name=table.name,
-                        connector=connector.name,
+                        connector=table.name,
                         docs=docs,
                         primary_key=list(table.primary_key),
                         foreign_keys=[
@@ -48,6 +48,9 @@ class MetaEnum(EnumMeta):
         """
         if isinstance(member, self):
             return True
+        if isinstance(member, str):
+            # Plain value lookup; avoids raising ValueError on every miss.
+            return member in self._value2member_map_
         try:
             self(member)
             return True
@@ -62,13 +65,10 @@ class BaseEnum(StrEnum, metaclass=MetaEnum):
     membership testing through the MetaEnum metaclass.
     """
 
-    def __str__(self) -> str:
-        """Return the enum value as string for proper serialization."""
-        return self.value
-
-    def __repr__(self) -> str:
-        """Return the enum value as string for proper serialization."""
-        return self.value
+    # Members are ``str`` instances whose content is their value, so the C-level
+    # ``str.__str__`` returns the value without a Python frame per call.
+    __str__ = str.__str__
+    __repr__ = str.__str__
 
 
 # Register custom YAML representer for BaseEnum to serialize as string values
@@ -81,8 +81,8 @@ def _register_yaml_representer():
             """Custom YAML representer for BaseEnum - serializes as string value."""
             return dumper.represent_scalar("tag:yaml.org,2002:str", str(data.value))
 
-        # Register for BaseEnum and use multi_representer for all subclasses
-        yaml.add_representer(BaseEnum, base_enum_representer)
+        # The multi-representer covers every subclass; enum members are never
+        # instances of BaseEnum itself, so an exact-type representer is unused.
         yaml.add_multi_representer(BaseEnum, base_enum_representer)
     except ImportError:
         # yaml not available, skip registration
@@ -1,11 +1,27 @@
+import copy
+import functools
 import pathlib
+from typing import TypeVar
 
 import pytest
-import yaml
 from suthing import FileHandle
 
 from graflo.architecture import EdgeConfig
+from graflo.architecture.base import ConfigBaseModel
 from graflo.architecture.schema.vertex import VertexConfig
+from test.yaml_util import load_yaml
+
+_ConfigT = TypeVar("_ConfigT", bound=ConfigBaseModel)
+
+
+@functools.cache
+def _build_config(cls: type[_ConfigT], text: str) -> _ConfigT:
+    return cls.from_dict(load_yaml(text))
+
+
+def _load_config(cls: type[_ConfigT], text: str) -> _ConfigT:
+    # Validate each config once per session; copying a built model is cheaper.
+    return copy.deepcopy(_build_config(cls, text))
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -22,7 +38,7 @@ def create_test_dirs():
 
 @pytest.fixture()
 def vertex_pub():
-    tc = yaml.safe_load(
+    tc = load_yaml(
         """
         name: publication
         properties:
@@ -53,7 +69,7 @@ def vertex_pub():
 
 @pytest.fixture()
 def vertex_helper():
-    tc = yaml.safe_load(
+    tc = load_yaml(
         """
         name: analyst
     """
@@ -63,7 +79,7 @@ def vertex_helper():
 
 @pytest.fixture()
 def vertex_helper_b():
-    tc = yaml.safe_load(
+    tc = load_yaml(
         """
             fields:
             -   datetime_review
@@ -75,7 +91,7 @@ def vertex_helper_b():
 
 @pytest.fixture()
 def vertex_config_kg():
-    vc = yaml.safe_load(
+    vc = load_yaml(
         """
     vertices:
     -   name: publication
@@ -110,7 +126,7 @@ def vertex_config_kg():
 
 @pytest.fixture()
 def edge_config_kg():
-    tc = yaml.safe_load(
+    tc = load_yaml(
         """
     edges:
     -   source: entity
@@ -127,7 +143,7 @@ def edge_config_kg():
 
 @pytest.fixture()
 def resource_concept():
-    mn = yaml.safe_load(
+    mn = load_yaml(
         """
         -   vertex: concept
         -   transform:
@@ -148,7 +164,9 @@ def resource_concept():
 
 @pytest.fixture()
 def schema_vc_openalex():
-    tc = yaml.safe_load("""
+    return _load_config(
+        VertexConfig,
+        """
     vertices:
     -   name: author
         properties:
@@ -204,13 +222,13 @@ def schema_vc_openalex():
         -   publication_year
         identity:
         -   _key
-    """)
-    return VertexConfig.from_dict(tc)
+    """,
+    )
 
 
 @pytest.fixture()
 def resource_descend():
-    tc = yaml.safe_load(
+    tc = load_yaml(
         """
         key: publications
         apply:
@@ -227,7 +245,7 @@ def resource_descend():
 
 @pytest.fixture()
 def action_node_edge():
-    tc = yaml.safe_load(
+    tc = load_yaml(
         """
         source: source
         target: work
@@ -239,7 +257,7 @@ def action_node_edge():
 
 @pytest.fixture()
 def action_node_transform():
-    an = yaml.safe_load("""
+    an = load_yaml("""
         transform:
             call:
                 module: graflo.util.transform
@@ -261,7 +279,9 @@ def sample_openalex():
 
 @pytest.fixture()
 def vertex_config_collision():
-    tc = yaml.safe_load("""
+    return _load_config(
+        VertexConfig,
+        """
     vertices:
     -   name: person
         properties:
@@ -269,13 +289,13 @@ def vertex_config_collision():
     -   name: company
         properties:
         -   id
-    """)
-    return VertexConfig.from_dict(tc)
+    """,
+    )
 
 
 @pytest.fixture()
 def sample_cross():
-    an = yaml.safe_load("""
+    an = load_yaml("""
     -   name: John
         id: Apple
     -   name: Mary
@@ -286,7 +306,7 @@ def sample_cross():
 
 @pytest.fixture()
 def resource_cross():
-    an = yaml.safe_load("""
+    an = load_yaml("""
     -   vertex: person
     -   vertex: company 
     -   transform:
@@ -307,7 +327,9 @@ def resource_collision():
 
 @pytest.fixture()
 def vertex_config_cross():
-    tc = yaml.safe_load("""
+    return _load_config(
+        VertexConfig,
+        """
     vertices:
     -   name: person
         properties:
@@ -315,13 +337,13 @@ def vertex_config_cross():
     -   name: company
         properties:
         -   name
-    """)
-    return VertexConfig.from_dict(tc)
+    """,
+    )
 
 
 @pytest.fixture()
 def resource_cross_implicit():
-    an = yaml.safe_load("""
+    an = load_yaml("""
     -   transform:
             rename:
                 name: id
@@ -332,7 +354,9 @@ def resource_cross_implicit():
 
 @pytest.fixture()
 def vc_openalex():
-    tc = yaml.safe_load("""
+    return _load_config(
+        VertexConfig,
+        """
     vertices:
     -   name: author
         properties:
@@ -344,8 +368,8 @@ def vc_openalex():
         -   display_name
         -   country
         -   type
-    """)
-    return VertexConfig.from_dict(tc)
+    """,
+    )
 
 
 @pytest.fixture()
@@ -356,7 +380,7 @@ def sample_openalex_authors():
 
 @pytest.fixture()
 def resource_openalex_authors():
-    an = yaml.safe_load("""
+    an = load_yaml("""
     -   vertex: author
     -   transform:
             call:
@@ -418,7 +442,7 @@ def mention_data():
 
 @pytest.fixture()
 def resource_kg_menton_triple():
-    an = yaml.safe_load("""
+    an = load_yaml("""
     -   key: triple_index
         apply:
         -   vertex: mention
@@ -445,15 +469,17 @@ def resource_kg_menton_triple():
 
 @pytest.fixture()
 def vertex_config_kg_mention():
-    tc = yaml.safe_load("""
+    return _load_config(
+        VertexConfig,
+        """
     vertices:
     -   name: mention
         properties:
         -   text
         identity:
         -   _key
-    """)
-    return VertexConfig.from_dict(tc)
+    """,
+    )
 
 
 @pytest.fixture()
@@ -483,21 +509,23 @@ def data_key_property():
 
 @pytest.fixture()
 def vertex_key_property():
-    tc = yaml.safe_load(
+    return _load_config(
+        VertexConfig,
         """
     vertices:
         -   name: package
             properties:
             -   name
             -   version
-    """
+    """,
     )
-    return VertexConfig.from_dict(tc)
 
 
 @pytest.fixture()
 def schema_vc_deb():
-    tc = yaml.safe_load("""
+    return _load_config(
+        VertexConfig,
+        """
     vertices:
     -   name: package
         properties:
@@ -513,13 +541,14 @@ def schema_vc_deb():
         -   subject
         -   severity
         -   date
-    """)
-    return VertexConfig.from_dict(tc)
+    """,
+    )
 
 
 @pytest.fixture()
 def vc_ticker():
-    tc = yaml.safe_load(
+    return _load_config(
+        VertexConfig,
         """
         vertices:
         -   name: ticker
@@ -531,28 +560,28 @@ def vc_ticker():
             properties:
             -   name
             -   value
-    """
+    """,
     )
-    return VertexConfig.from_dict(tc)
 
 
 @pytest.fixture()
 def ec_ticker():
-    tc = yaml.safe_load(
+    return _load_config(
+        EdgeConfig,
         """
     edges:
     -   source: ticker
         target: feature
         properties:
         -   t_obs
-    """
+    """,
     )
-    return EdgeConfig.from_dict(tc)
 
 
 @pytest.fixture()
 def vc_ticker_filtered():
-    tc = yaml.safe_load(
+    return _load_config(
+        VertexConfig,
         """
         vertices:
         -   name: ticker
@@ -568,9 +597,8 @@ def vc_ticker_filtered():
             -   field: name
                 foo: __ne__
                 value: Volume                        
-    """
+    """,
     )
-    return VertexConfig.from_dict(tc)
 
 
 @pytest.fixture()
@@ -132,6 +132,29 @@ def test_rename_vertex_fields_rewrites_identity():
     assert "user_id" in [f.name for f in users.properties]
 
 
+def test_rename_vertex_fields_leaves_unrelated_pipeline_untouched():
+    """Resources that never reference a renamed vertex keep their steps.
+
+    The steps come back normalized, as they do when a rename applies.
+    """
+    from graflo.architecture.evolution.rewrite import (
+        rewrite_vertex_field_names_in_pipeline,
+    )
+
+    pipeline = [{"vertex": "orders", "from": {"id": "order_id"}}]
+    out = rewrite_vertex_field_names_in_pipeline(
+        pipeline, {"users": {"user-name": "user_name"}}
+    )
+    assert out == [{"type": "vertex", "vertex": "orders", "from": {"id": "order_id"}}]
+    assert out[0]["from"] is not pipeline[0]["from"]
+    assert pipeline == [{"vertex": "orders", "from": {"id": "order_id"}}]
+
+    renamed = rewrite_vertex_field_names_in_pipeline(
+        pipeline, {"orders": {"total": "amount"}}
+    )
+    assert renamed[0].keys() == out[0].keys()
+
+
 def test_rename_vertex_fields_validates_unknown_vertex():
     manifest = _build_manifest()
     try:
@@ -818,3 +841,85 @@ def test_apply_sanitize_tigergraph_reserved_word_vertex_storage_name():
 
     schema = manifest.require_schema()
     assert schema.db_profile.vertex_storage_name("package") == "package_vertex"
+
+
+def test_apply_sanitize_relation_colliding_with_vertex_names_is_consistent():
+    """Edges sharing a relation that collides with vertex names get one suffix."""
+    manifest = _build_tigergraph_manifest(
+        vertices=[
+            Vertex(name=name, properties=[Field(name="id")], identity=["id"])
+            for name in ("person", "city", "lives", "lives_relation")
+        ],
+        edges=[
+            Edge(source="person", target="city", relation="lives"),
+            Edge(source="city", target="person", relation="lives"),
+        ],
+        resource_name="person",
+    )
+    apply_sanitize(manifest, SanitizeOp(db_flavor=DBType.TIGERGRAPH))
+
+    schema = manifest.require_schema()
+    relation_names = {
+        schema.db_profile.edge_relation_name(
+            edge.edge_id,
+            default_relation=edge.relation,
+        )
+        for edge in schema.core_schema.edge_config.edges
+    }
+    assert relation_names == {"lives_relation_1"}
+
+
+def test_apply_sanitize_distinct_relations_do_not_share_physical_name():
+    """Two relations that sanitize to the same identifier stay distinct."""
+    manifest = _build_tigergraph_manifest(
+        edges=[
+            Edge(source="my-entity", target="my-entity", relation="knows-someone"),
+            Edge(source="my-entity", target="my-entity", relation="knows__someone"),
+        ],
+    )
+    apply_sanitize(manifest, SanitizeOp(db_flavor=DBType.TIGERGRAPH))
+
+    schema = manifest.require_schema()
+    relation_names = {
+        edge.relation: schema.db_profile.edge_relation_name(
+            edge.edge_id,
+            default_relation=edge.relation,
+        )
+        for edge in schema.core_schema.edge_config.edges
+    }
+    assert relation_names == {
+        "knows__someone": "knows__someone",
+        "knows-someone": "knows__someone_relation",
+    }
+
+
+def test_apply_sanitize_repeated_relation_keeps_one_physical_name():
+    """Edges sharing a colliding relation resolve to the same physical name."""
+    manifest = _build_tigergraph_manifest(
+        vertices=[
+            Vertex(name="my-entity", properties=[Field(name="id")], identity=["id"]),
+            Vertex(name="other", properties=[Field(name="id")], identity=["id"]),
+        ],
+        edges=[
+            Edge(source="my-entity", target="my-entity", relation="knows__someone"),
+            Edge(source="my-entity", target="my-entity", relation="knows-someone"),
+            Edge(source="my-entity", target="other", relation="knows someone"),
+            Edge(source="other", target="my-entity", relation="knows-someone"),
+        ],
+    )
+    apply_sanitize(manifest, SanitizeOp(db_flavor=DBType.TIGERGRAPH))
+
+    schema = manifest.require_schema()
+    relation_names: dict[str | None, set[str | None]] = {}
+    for edge in schema.core_schema.edge_config.edges:
+        relation_names.setdefault(edge.relation, set()).add(
+            schema.db_profile.edge_relation_name(
+                edge.edge_id,
+                default_relation=edge.relation,
+            )
+        )
+    assert relation_names == {
+        "knows__someone": {"knows__someone"},
+        "knows-someone": {"knows__someone_relation"},
+        "knows someone": {"knows__someone_relation_1"},
+    }
@@ -199,3 +199,32 @@ def test_writer_resume_appends_chunks(tmp_path: Path) -> None:
     index = reader.read_index()
     assert index.vertices["person"].record_count == 2
     assert len(index.vertices["person"].chunks) == 2
+
+
+def test_graflo_backend_fetch_edges_applies_filters(tmp_path: Path) -> None:
+    schema = _sample_schema()
+    config = GraFloBackendConfig(output_dir=tmp_path, chunk_size=10)
+
+    with ConnectionManager(connection_config=config) as conn:
+        conn.init_db(schema, recreate_schema=True)
+        conn.insert_edges_batch(
+            [
+                [{"id": "1"}, {"id": "2"}, {"since": 2020}],
+                [{"id": "1"}, {"id": "3"}, {"since": 2010}],
+            ],
+            "person",
+            "person",
+            "knows",
+            match_keys_source=("id",),
+            match_keys_target=("id",),
+        )
+
+    with ConnectionManager(connection_config=config) as conn:
+        assert len(conn.fetch_edges("person", "1", edge_type="knows")) == 2
+        edges = conn.fetch_edges(
+            "person",
+            "1",
+            edge_type="knows",
+            filters={"field": "since", "cmp_operator": ">", "value": 2015},
+        )
+    assert [(edge["_to_key"], edge["since"]) for edge in edges] == [("2", 2020)]
@@ -208,3 +208,36 @@ def test_contract_import_loads_no_db_driver():
         "assert not loaded, f'contract import loaded DB drivers: {loaded}'\n"
     )
     subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_contract_import_loads_no_pandas():
+    """The contract defers pandas to the code paths that need it."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import graflo.architecture.contract\n"
+        "assert 'pandas' not in sys.modules, 'contract import loaded pandas'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_connection_manager_loads_drivers_on_demand():
+    """ConnectionManager resolves a backend, and its driver, only when used."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from graflo.db.manager import ConnectionManager\n"
+        "from graflo.onto import DBType\n"
+        "drivers = ('arango', 'neo4j', 'pyTigerGraph', 'falkordb', 'nebula3',"
+        " 'psycopg2')\n"
+        "loaded = [m for m in drivers if m in sys.modules]\n"
+        "assert not loaded, f'manager import loaded DB drivers: {loaded}'\n"
+        "ConnectionManager.target_conn_mapping[DBType.GRAFLO_BACKEND]\n"
+        "loaded = [m for m in drivers if m in sys.modules]\n"
+        "assert not loaded, f'file backend lookup loaded DB drivers: {loaded}'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -383,6 +383,42 @@ class TestTableConnectorBuildQuery:
         assert "base.\"created_at\" >= '2024-01-01'" in q
         assert "base.\"status\" = 'active'" in q
 
+    def test_query_tracks_in_place_changes(self):
+        tp = TableConnector(
+            table_name="events",
+            time_filter=ColumnTimeFilter(column="created_at", start="2020-01-01"),
+            filters=[
+                FilterExpression(
+                    kind="leaf",
+                    field="age",
+                    cmp_operator=ComparisonOperator.GE,
+                    value=[18],
+                )
+            ],
+        )
+        q = tp.build_query("public")
+        assert "'2020-01-01'" in q
+        assert '"age" >= 18' in q
+
+        assert tp.time_filter is not None
+        tp.time_filter.start = "2021-01-01"
+        tp.filters[0].value = [21]
+        tp.filters.append(
+            FilterExpression(
+                kind="leaf",
+                field="status",
+                cmp_operator=ComparisonOperator.EQ,
+                value=["active"],
+            )
+        )
+        q = tp.build_query("public")
+        assert "'2021-01-01'" in q
+        assert '"age" >= 21' in q
+        assert "\"status\" = 'active'" in q
+
+        tp.filters[0].value[0] = 30
+        assert '"age" >= 30' in tp.build_where_clause()
+
     def test_date_range_query_runs_on_sqlite_without_interval(self):
         fd, path = tempfile.mkstemp(suffix=".db")
         os.close(fd)
@@ -517,6 +553,29 @@ class TestAutoJoin:
 
         assert len(connector.joins) == 2
 
+    def test_enrichment_refreshes_built_query(self):
+        from graflo.hq.auto_join import enrich_edge_connector_with_joins
+
+        schema, ingestion_model, bindings = self._make_schema_and_patterns()
+        resource = ingestion_model.fetch_resource("abc_relations")
+        connector = bindings.get_connectors_for_resource("abc_relations")[0]
+        assert isinstance(connector, TableConnector)
+        connector.joins = []
+        connector.filters = []
+        assert "JOIN" not in connector.build_query("public")
+
+        enrich_edge_connector_with_joins(
+            resource=resource,
+            connector=connector,
+            bindings=bindings,
+            vertex_config=schema.core_schema.vertex_config,
+        )
+
+        q = connector.build_query("public")
+        assert q.count("INNER JOIN") == 2
+        assert 'INNER JOIN "sn"."classes" s ON base."parent" = s."id"' in q
+        assert "IS NOT NULL" not in q
+
     def test_enrichment_accepts_resource_config_without_finish_init(self):
         from graflo.hq.auto_join import enrich_edge_connector_with_joins
 
@@ -541,7 +600,7 @@ class TestAutoJoin:
         on_self_cols = {j.on_self for j in connector.joins}
         assert on_self_cols == {"parent", "child"}
 
-    def test_enrichment_adds_is_not_null_filters(self):
+    def test_enrichment_uses_inner_joins(self):
         from graflo.hq.auto_join import enrich_edge_connector_with_joins
 
         schema, ingestion_model, bindings = self._make_schema_and_patterns()
@@ -556,10 +615,39 @@ class TestAutoJoin:
             vertex_config=schema.core_schema.vertex_config,
         )
 
-        assert len(connector.filters) == 2
-        rendered = [f(kind=ExpressionFlavor.SQL) for f in connector.filters]
-        assert 's."id" IS NOT NULL' in rendered
-        assert 't."id" IS NOT NULL' in rendered
+        assert [j.join_type for j in connector.joins] == ["INNER", "INNER"]
+        assert connector.filters == []
+
+    def test_enrichment_dedupes_repeated_edge_steps(self):
+        from graflo.architecture.contract.ingestion import IngestionModel
+        from graflo.hq.auto_join import enrich_edge_connector_with_joins
+
+        schema, _, bindings = self._make_schema_and_patterns()
+        step = {
+            "edge": {
+                "from": "server",
+                "to": "database",
+                "match_source": "parent",
+                "match_target": "child",
+            }
+        }
+        ingestion_model = IngestionModel.model_validate(
+            {"resources": [{"name": "abc_relations", "pipeline": [step, step]}]}
+        )
+        ingestion_model.finish_init(schema.core_schema)
+        connector = bindings.get_connectors_for_resource("abc_relations")[0]
+        assert isinstance(connector, TableConnector)
+
+        enrich_edge_connector_with_joins(
+            resource=ingestion_model.fetch_resource("abc_relations"),
+            connector=connector,
+            bindings=bindings,
+            vertex_config=schema.core_schema.vertex_config,
+        )
+
+        assert [j.alias for j in connector.joins] == ["s", "t"]
+        assert [j.join_type for j in connector.joins] == ["INNER", "INNER"]
+        assert connector.filters == []
 
     def test_enrichment_noop_when_joins_already_set(self):
         from graflo.hq.auto_join import enrich_edge_connector_with_joins
@@ -597,8 +685,8 @@ class TestAutoJoin:
         )
 
         q = connector.build_query("sn")
-        assert "LEFT JOIN" in q
-        assert "IS NOT NULL" in q
+        assert "INNER JOIN" in q
+        assert "IS NOT NULL" not in q
         assert '"sn"."cmdb_rel_ci"' in q
 
     def test_enrichment_raises_when_vertex_has_multiple_sql_sources(self):
@@ -480,6 +480,15 @@ def test_vertex_config_remove_vertices():
     assert config.blank_vertices == []
 
 
+def test_vertex_config_vertex_set_tracks_updates():
+    config = VertexConfig(vertices=[Vertex(name="a", properties=["id"])])
+    assert config.vertex_set is config.vertex_set
+    config.update_vertex(Vertex(name="b", properties=["id"]))
+    assert config.vertex_set == {"a", "b"}
+    config.vertices = [Vertex(name="c", properties=["id"])]
+    assert config.vertex_set == {"c"}
+
+
 def test_vertex_config_identity_fallback_when_flag_enabled():
     """Compatibility flag enables identity fallback to all property names."""
     vertex = Vertex.model_validate({"name": "user", "properties": ["id", "name"]})
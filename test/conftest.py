@@ -5,13 +5,13 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
-import yaml
 from suthing import FileHandle, equals
 
 from graflo.architecture.contract.bindings import Bindings, FileConnector
 from graflo.architecture.contract.manifest import GraphManifest
 from graflo.architecture.util import cast_graph_name_to_triple
 from graflo.util.misc import sorted_dicts
+from test.yaml_util import load_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -279,7 +279,7 @@ def row_doc_ibes() -> dict[str, list]:
 
 @pytest.fixture()
 def row_resource_transform_collision():
-    tc = yaml.safe_load(
+    tc = load_yaml(
         """
         name: pets
         transforms:
@@ -293,7 +293,7 @@ def row_resource_transform_collision():
 
 @pytest.fixture()
 def vertex_config_transform_collision():
-    vc = yaml.safe_load(
+    vc = load_yaml(
         """
         vertices:
         -
@@ -312,7 +312,7 @@ def vertex_config_transform_collision():
 
 @pytest.fixture()
 def resource_openalex_works():
-    return yaml.safe_load("""
+    return load_yaml("""
     -   vertex: work
     -   transform:
             call:
@@ -357,7 +357,7 @@ def resource_openalex_works():
 
 @pytest.fixture()
 def resource_deb():
-    return yaml.safe_load("""
+    return load_yaml("""
     -   name: package
         apply:
         -   vertex: package
@@ -395,7 +395,7 @@ def resource_deb():
 
 @pytest.fixture()
 def resource_deb_compact():
-    return yaml.safe_load("""
+    return load_yaml("""
     -   name: package
         apply:
         -   vertex: package
@@ -419,7 +419,7 @@ def resource_deb_compact():
 @pytest.fixture()
 def resource_deb_package_only():
     """Package-package edges only via relation_from_key (example 4 style). No maintainer."""
-    return yaml.safe_load("""
+    return load_yaml("""
     -   name: package
         apply:
         -   vertex: package
@@ -436,7 +436,7 @@ def resource_deb_package_only():
 
 @pytest.fixture()
 def resource_ticker():
-    return yaml.safe_load("""
+    return load_yaml("""
     name: ticker_data
     apply:
     -   transform:
@@ -384,8 +384,8 @@ class TestEdgeResourceAutoJoin:
 
         q = tp_edge.build_query("main")
         # Structure checks
-        assert "LEFT JOIN" in q
-        assert "IS NOT NULL" in q
+        assert "INNER JOIN" in q
+        assert "IS NOT NULL" not in q
         assert '"main"."relations"' in q
         assert '"main"."classes"' in q
 
@@ -9,7 +9,9 @@ from graflo.architecture.contract.bindings import (
     ColumnTimeFilter,
     ConnectorUpdate,
     FileConnector,
+    ResourceConnector,
     ResourceConnectorBinding,
+    SparqlConnector,
     TableConnector,
 )
 
@@ -59,6 +61,29 @@ def test_file_connector_basic():
     assert pattern.date_field is None
 
 
+def test_file_connector_matches_tracks_regex_assignment() -> None:
+    connector = FileConnector(regex=r".*\.csv$")
+    assert connector.matches("a.csv")
+    assert not connector.matches("a.json")
+    connector.regex = r".*\.json$"
+    assert connector.matches("a.json")
+    assert not connector.matches("a.csv")
+    assert not FileConnector().matches("a.csv")
+
+
+def test_file_connector_matches_file_name_searches() -> None:
+    connector = FileConnector(regex=r"\.csv$")
+    assert connector.matches_file_name("data/a.csv")
+    assert not connector.matches("a.csv")
+    assert not connector.matches_file_name("a.json")
+    assert FileConnector().matches_file_name("a.json")
+
+
+def test_file_connector_rejects_invalid_regex() -> None:
+    with pytest.raises(ValidationError, match="Invalid regex"):
+        FileConnector(regex="(")
+
+
 def test_file_connector_rejects_unknown_time_keys() -> None:
     """Legacy flat date_* keys are not accepted (extra=forbid)."""
     with pytest.raises(ValidationError):
@@ -98,6 +123,31 @@ def test_table_connector_basic():
     assert pattern.schema_name == "public"
 
 
+def test_table_connector_matches_exact_and_regex_names() -> None:
+    exact = TableConnector(table_name="user.events")
+    assert exact.matches("user.events")
+    assert not exact.matches("userXevents")
+    regex = TableConnector(table_name="^public\\.ev.*", schema_name="public")
+    assert regex.matches("events")
+    assert not regex.matches("users")
+    regex.table_name = "users"
+    assert regex.matches("users")
+    assert not regex.matches("events")
+    assert not TableConnector.model_construct(table_name="").matches("")
+
+
+def test_sparql_connector_matches_class_local_name() -> None:
+    connector = SparqlConnector(rdf_class="http://example.org/onto#Person")
+    assert connector.matches("Person")
+    assert not connector.matches("onto#Person")
+    connector.rdf_class = "http://example.org/Organization"
+    assert connector.matches("Organization")
+    assert not connector.matches("Person")
+    assert "<http://example.org/Organization>" in connector.build_select_query()
+    connector.sparql_query = "SELECT ?s WHERE { ?s ?p ?o }"
+    assert connector.build_select_query() == "SELECT ?s WHERE { ?s ?p ?o }"
+
+
 def test_table_connector_rejects_unknown_time_keys() -> None:
     with pytest.raises(ValidationError):
         TableConnector.model_validate(
@@ -337,6 +387,14 @@ def test_bindings_support_connector_resource_name_mapping():
     assert conns[0].bound_source_kind() == BoundSourceKind.FILE
 
 
+def test_concrete_connector_requires_source_kind():
+    with pytest.raises(TypeError, match="source_kind"):
+
+        class UnkindConnector(ResourceConnector):
+            def matches(self, resource_identifier: str) -> bool:
+                return False
+
+
 def test_bindings_support_top_level_resource_connector_objects():
     bindings = Bindings(
         connectors=[
@@ -5,6 +5,7 @@ from graflo.filter.onto import (
     FilterExpression,
     LogicalOperator,
 )
+from graflo.onto import ExpressionFlavor
 
 
 @pytest.fixture()
@@ -68,3 +69,22 @@ def test_init_filter_eq(eq_clause):
 def test_init_filter_in(in_clause):
     c = FilterExpression.from_dict(in_clause)
     assert c() == "IN [1, 2]"
+
+
+def test_leaf_render_tracks_assignment(eq_clause):
+    lc = FilterExpression.from_list(eq_clause)
+    assert lc() == 'doc["x"] == "1"'
+    assert lc(doc_name="d") == 'd["x"] == "1"'
+    lc.field = "z"
+    assert lc() == 'doc["z"] == "1"'
+    assert lc(kind=ExpressionFlavor.PYTHON, z="1") is True
+
+
+def test_render_tracks_in_place_value_changes(and_clause):
+    c = FilterExpression.from_dict(and_clause)
+    assert c() == 'doc["x"] == "1" AND doc["y"] % 2 == 2'
+    c.deps[0].value[0] = "3"
+    assert c() == 'doc["x"] == "3" AND doc["y"] % 2 == 2'
+    c.deps[1].value.append(5)
+    c.deps[1].value.pop(0)
+    assert c() == 'doc["x"] == "3" AND doc["y"] % 2 == 5'
@@ -454,10 +454,8 @@ def _apply_vertex_filters(
     docs: list[dict],
 ) -> list[dict]:
     """Replicate the filtering logic from VertexActor._filter_and_aggregate_vertex_docs."""
-    filters = vertex_config.filters(vertex_name)
-    return [
-        d for d in docs if all(f(kind=ExpressionFlavor.PYTHON, **d) for f in filters)
-    ]
+    predicates = [f.compile_python() for f in vertex_config.filters(vertex_name)]
+    return [d for d in docs if all(p(d) for p in predicates)]
 
 
 def test_vertex_config_parses_foo_filters(vertex_config_with_filters):
@@ -506,3 +504,57 @@ def test_vertex_filter_no_filters_passes_all(sample_vertex_docs):
     )
     result = _apply_vertex_filters(vc, "raw", sample_vertex_docs)
     assert len(result) == len(sample_vertex_docs)
+
+
+def test_compile_python_matches_call(clause_ab, filter_implication, clause_volume):
+    docs = [
+        {"name": "Open", "value": 5.0},
+        {"name": "Open", "value": -1.0},
+        {"name": "Close", "value": 5.0},
+        {"name": "Volume", "value": -1.0},
+        {"name": "Volume"},
+        {},
+    ]
+    expressions = [
+        FilterExpression.from_dict(clause_ab),
+        FilterExpression.from_dict(filter_implication),
+        FilterExpression.from_dict(clause_volume),
+        FilterExpression.from_dict({LogicalOperator.NOT: [clause_volume]}),
+        FilterExpression.from_dict({"field": "value", "cmp_operator": "IS_NULL"}),
+        FilterExpression.from_dict({"field": "value", "cmp_operator": "IS_NOT_NULL"}),
+        FilterExpression.from_list([ComparisonOperator.IN, ["Open", "Close"], "name"]),
+    ]
+    for expression in expressions:
+        predicate = expression.compile_python()
+        assert expression.compile_python() is predicate
+        for doc in docs:
+            assert predicate(doc) == expression(kind=ExpressionFlavor.PYTHON, **doc)
+
+
+def test_compile_python_tracks_assignment(clause_a):
+    m = FilterExpression.from_dict(clause_a)
+    doc = {"name": "Close", "value": 5.0}
+    assert not m.compile_python()(doc)
+    m.deps[0].value = ["Close"]
+    assert m.compile_python()(doc)
+    m.operator = LogicalOperator.OR
+    assert m.compile_python()({"name": "Close", "value": -1.0})
+
+
+def test_compile_python_tracks_in_place_value_changes(clause_a):
+    m = FilterExpression.from_dict(clause_a)
+    predicate = m.compile_python()
+    doc = {"name": "Close", "value": 5.0}
+    assert not predicate(doc)
+    m.deps[0].value[0] = "Close"
+    assert predicate(doc)
+    m.deps[1].value.append(10.0)
+    m.deps[1].value.pop(0)
+    assert not predicate(doc)
+
+    member = FilterExpression(
+        kind="leaf", cmp_operator=ComparisonOperator.IN, field="name", value=["Open"]
+    )
+    assert not member.compile_python()(doc)
+    member.value.append("Close")
+    assert member.compile_python()(doc)
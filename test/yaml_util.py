@@ -0,0 +1,22 @@
+"""YAML loading shared by the test conftests."""
+
+import copy
+import functools
+
+import yaml
+
+# libyaml's C loader parses the fixture literals several times faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.cache
+def _parse_yaml(text: str):
+    return yaml.load(text, Loader=_YAML_LOADER)
+
+
+def load_yaml(text: str):
+    """Parse a YAML literal, returning a private copy the caller may mutate.
+
+    Each literal is parsed once per session.
+    """
+    return copy.deepcopy(_parse_yaml(text))